@@ -44,6 +44,21 @@ GitHub: https://github.com/matheuslaidler/tarefauto
 import sys         # Acesso a funcionalidades do sistema Python
 import os          # Operações do sistema operacional
 import platform    # Informações da plataforma (Windows, Linux, etc)
+import threading   # Pré-carregamento da interface em segundo plano
+
+
+# ============================================================================
+# BYTECODE (.pyc)
+# ============================================================================
+
+# No executável (PyInstaller) ou quando o programa está em uma pasta sem
+# permissão de escrita, o Python tentaria (e falharia silenciosamente)
+# gravar arquivos .pyc a cada primeira importação. Desativamos isso antes
+# de qualquer importação pesada para poupar essas tentativas inúteis.
+if getattr(sys, "frozen", False) or not os.access(
+    os.path.dirname(os.path.abspath(__file__)), os.W_OK
+):
+    sys.dont_write_bytecode = True
 
 
 # ============================================================================
@@ -56,6 +71,46 @@ MIN_PYTHON_VERSION = (3, 8)
 # Nome do aplicativo (usado em mensagens)
 APP_NAME = "TarefAuto"
 
+# Linha separadora usada nas mensagens do console (criada uma única vez)
+_SEP = "=" * 60
+
+# Dependências necessárias (tupla: criada uma vez, ao carregar o módulo)
+# Formato: (nome do pacote para import, nome do pacote para pip)
+_DEPENDENCIES = (
+    ("pynput", "pynput"),
+    ("customtkinter", "customtkinter"),
+    ("PIL", "Pillow"),  # PIL é o módulo, Pillow é o pacote pip
+)
+
+# Nome do sistema operacional ("Windows", "Linux", "Darwin"...)
+# Calculado uma única vez: platform.system() pode consultar uname() ou
+# até chamar processos externos em versões antigas do macOS
+_SYSTEM = platform.system()
+
+
+# Banner simples em ASCII - TAREFAUTO
+# Codificado em UTF-8 uma única vez, ao carregar o módulo, porque o texto
+# nunca muda.
+BANNER: bytes = """
+╔════════════════════════════════════════════════════════════════════════════════╗
+║                                                                                ║
+║  ████████╗ █████╗ ██████╗ ███████╗███████╗ █████╗ ██╗   ██╗████████╗ ██████╗   ║
+║  ╚══██╔══╝██╔══██╗██╔══██╗██╔════╝██╔════╝██╔══██╗██║   ██║╚══██╔══╝██╔═══██╗  ║
+║     ██║   ███████║██████╔╝█████╗  █████╗  ███████║██║   ██║   ██║   ██║   ██║  ║
+║     ██║   ██╔══██║██╔══██╗██╔══╝  ██╔══╝  ██╔══██║██║   ██║   ██║   ██║   ██║  ║
+║     ██║   ██║  ██║██║  ██║███████╗██║     ██║  ██║╚██████╔╝   ██║   ╚██████╔╝  ║
+║     ╚═╝   ╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝╚═╝     ╚═╝  ╚═╝ ╚═════╝    ╚═╝    ╚═════╝   ║
+║                                                                                ║
+║                   🤖 Automação de Tarefas Repetitivas 🤖                       ║
+║                                                                                ║
+║                          Desenvolvido por:                                     ║
+║                          Matheus Laidler                                       ║
+║                https://github.com/matheuslaidler/tarefauto                     ║
+║                                                                                ║
+╚════════════════════════════════════════════════════════════════════════════════╝
+
+""".encode("utf-8")
+
 
 # ============================================================================
 # FUNÇÕES DE VERIFICAÇÃO
@@ -73,34 +128,64 @@ def check_python_version() -> bool:
     https://www.python.org/downloads/
     
     EXPLICAÇÃO TÉCNICA:
-    Compara sys.version_info com MIN_PYTHON_VERSION usando
-    comparação de tuplas.
+    Compara sys.version_info diretamente com MIN_PYTHON_VERSION usando
+    comparação de tuplas, sem fatiar (o slice criaria uma tupla nova).
+    Os números da versão só são lidos no caminho de erro.
     
     Returns:
         bool: True se versão é compatível, False caso contrário
     """
     # sys.version_info é uma tupla: (major, minor, micro, ...)
     # Exemplo: Python 3.10.5 = (3, 10, 5, ...)
+    # (3, 10, 5, ...) < (3, 8) compara elemento a elemento, então não
+    # precisamos recortar apenas (major, minor)
     
-    current_version = sys.version_info[:2]  # Pega apenas (major, minor)
-    
-    if current_version < MIN_PYTHON_VERSION:
+    if sys.version_info < MIN_PYTHON_VERSION:
         # Versão incompatível - mostra erro e instruções
-        print("=" * 60)
+        major, minor = sys.version_info.major, sys.version_info.minor
+        print(_SEP)
         print(f"ERRO: Versão do Python incompatível!")
-        print("=" * 60)
+        print(_SEP)
         print(f"")
-        print(f"Versão atual:   Python {current_version[0]}.{current_version[1]}")
+        print(f"Versão atual:   Python {major}.{minor}")
         print(f"Versão mínima:  Python {MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]}")
         print(f"")
         print(f"Por favor, atualize seu Python:")
         print(f"https://www.python.org/downloads/")
-        print("=" * 60)
+        print(_SEP)
         return False
     
     return True
 
 
+def _module_available(name: str) -> bool:
+    """
+    Verifica se um módulo está instalado, sem importá-lo.
+    
+    EXPLICAÇÃO PARA INICIANTES:
+    Responde "este pacote está instalado?" sem carregar o pacote.
+    
+    EXPLICAÇÃO TÉCNICA:
+    Primeiro consulta sys.modules (O(1) se o módulo já foi importado,
+    por exemplo pelo pré-carregamento da interface) e só então usa
+    importlib.util.find_spec(). Atenção: para nomes com ponto
+    ("pacote.sub"), find_spec importa o pacote pai - use apenas nomes
+    de nível superior quando não quiser importar nada.
+    
+    Args:
+        name (str): Nome do módulo para import (ex: "PIL")
+    
+    Returns:
+        bool: True se o módulo está disponível
+    """
+    if name in sys.modules:
+        return True
+    
+    # find_spec só procura o módulo (finder/loader), sem executar seu código
+    from importlib.util import find_spec
+    return find_spec(name) is not None
+
+
 def check_dependencies() -> bool:
     """
     Verifica se todas as dependências estão instaladas.
@@ -113,60 +198,64 @@ def check_dependencies() -> bool:
     pip install -r requirements.txt
     
     EXPLICAÇÃO TÉCNICA:
-    Tenta importar cada dependência e captura ImportError para
-    dependências faltantes. Mostra instruções de instalação.
+    Usa _module_available() (sys.modules + importlib.util.find_spec())
+    para localizar cada dependência sem executá-la. Importar de verdade (com __import__) rodaria o corpo de
+    pacotes pesados como PIL e customtkinter só para descobrir que eles
+    existem. Como checamos apenas pacotes de nível superior, find_spec
+    não importa nenhum pacote pai.
     
     Returns:
         bool: True se todas as dependências estão OK, False caso contrário
     """
-    # Lista de dependências necessárias
-    # Formato: (nome do pacote para import, nome do pacote para pip)
-    dependencies = [
-        ("pynput", "pynput"),
-        ("customtkinter", "customtkinter"),
-        ("PIL", "Pillow"),  # PIL é o módulo, Pillow é o pacote pip
-    ]
-    
     missing = []
     
-    for import_name, pip_name in dependencies:
-        try:
-            # Tenta importar o módulo
-            __import__(import_name)
-        except ImportError:
-            # Não encontrou - adiciona à lista de faltantes
+    for import_name, pip_name in _DEPENDENCIES:
+        # Não encontrou - adiciona à lista de faltantes
+        if not _module_available(import_name):
             missing.append(pip_name)
     
     if missing:
         # Tem dependências faltando - mostra erro e instruções
-        print("=" * 60)
-        print(f"ERRO: Dependências faltando!")
-        print("=" * 60)
-        print(f"")
-        print(f"Os seguintes pacotes não estão instalados:")
-        for pkg in missing:
-            print(f"  • {pkg}")
-        print(f"")
-        print(f"Para instalar, execute um dos comandos abaixo:")
-        print(f"")
-        print(f"  Opção 1 - Instalar tudo de uma vez:")
-        print(f"    pip install -r requirements.txt")
-        print(f"")
-        print(f"  Opção 2 - Instalar manualmente:")
-        print(f"    pip install {' '.join(missing)}")
-        print(f"")
+        # A mensagem inteira é montada antes e escrita de uma vez só
+        # (uma única escrita no console em vez de uma por linha)
+        packages = "\n".join(f"  • {pkg}" for pkg in missing)
         
         # Dica específica para cada sistema
-        system = platform.system()
+        system = _SYSTEM
         if system == "Windows":
-            print(f"  Dica para Windows:")
-            print(f"    Se 'pip' não funcionar, tente 'py -m pip install ...'")
+            hint = (
+                "  Dica para Windows:\n"
+                "    Se 'pip' não funcionar, tente 'py -m pip install ...'\n"
+            )
         elif system == "Linux":
-            print(f"  Dica para Linux:")
-            print(f"    Se 'pip' não funcionar, tente 'pip3 install ...'")
-            print(f"    Você pode precisar de: sudo apt install python3-tk")
+            hint = (
+                "  Dica para Linux:\n"
+                "    Se 'pip' não funcionar, tente 'pip3 install ...'\n"
+                "    Você pode precisar de: sudo apt install python3-tk\n"
+            )
+        else:
+            hint = ""
         
-        print("=" * 60)
+        sys.stdout.write(
+            f"{_SEP}\n"
+            "ERRO: Dependências faltando!\n"
+            f"{_SEP}\n"
+            "\n"
+            "Os seguintes pacotes não estão instalados:\n"
+            f"{packages}\n"
+            "\n"
+            "Para instalar, execute um dos comandos abaixo:\n"
+            "\n"
+            "  Opção 1 - Instalar tudo de uma vez:\n"
+            "    pip install -r requirements.txt\n"
+            "\n"
+            "  Opção 2 - Instalar manualmente:\n"
+            f"    pip install {' '.join(missing)}\n"
+            "\n"
+            f"{hint}"
+            f"{_SEP}\n"
+        )
+        sys.stdout.flush()
         return False
     
     return True
@@ -187,22 +276,27 @@ def check_platform_compatibility() -> bool:
     
     EXPLICAÇÃO TÉCNICA:
     Detecta a plataforma e compositor de display (Linux) para
-    exibir avisos relevantes ao usuário.
+    exibir avisos relevantes ao usuário. Usa sys.platform, que é uma
+    string constante ('linux', 'darwin', 'win32'), em vez de chamar
+    platform.system().
     
     Returns:
         bool: True (sempre, apenas mostra avisos)
     """
-    system = platform.system()
+    sp = sys.platform
     
-    if system == "Linux":
+    if sp == "linux":
         # Verifica se está usando Wayland
-        wayland_display = os.environ.get("WAYLAND_DISPLAY")
-        xdg_session = os.environ.get("XDG_SESSION_TYPE", "")
+        # O "or" só consulta XDG_SESSION_TYPE se WAYLAND_DISPLAY não existir
+        env = os.environ
+        is_wayland = bool(env.get("WAYLAND_DISPLAY")) or (
+            env.get("XDG_SESSION_TYPE", "").lower() == "wayland"
+        )
         
-        if wayland_display or xdg_session.lower() == "wayland":
-            print("=" * 60)
+        if is_wayland:
+            print(_SEP)
             print("⚠️  AVISO: Sessão Wayland detectada")
-            print("=" * 60)
+            print(_SEP)
             print("")
             print("O TarefAuto funciona melhor com X11.")
             print("No Wayland, a captura global de eventos pode não funcionar.")
@@ -212,13 +306,13 @@ def check_platform_compatibility() -> bool:
             print("  2. Use XWayland para apps específicos")
             print("")
             print("O programa tentará funcionar, mas pode haver limitações.")
-            print("=" * 60)
+            print(_SEP)
             print("")
     
-    elif system == "Darwin":  # macOS
-        print("=" * 60)
+    elif sp == "darwin":  # macOS
+        print(_SEP)
         print("ℹ️  AVISO: macOS detectado")
-        print("=" * 60)
+        print(_SEP)
         print("")
         print("No macOS, você precisa conceder permissões de acessibilidade")
         print("ao terminal ou ao Python para capturar eventos de teclado.")
@@ -227,7 +321,7 @@ def check_platform_compatibility() -> bool:
         print("       > Privacidade > Acessibilidade")
         print("")
         print("E adicione o Terminal ou Python à lista de apps permitidos.")
-        print("=" * 60)
+        print(_SEP)
         print("")
     
     return True
@@ -242,94 +336,79 @@ def show_startup_banner() -> None:
     versão e informações úteis.
     
     EXPLICAÇÃO TÉCNICA:
-    Imprime ASCII art e informações do projeto no console.
+    Escreve o banner pré-codificado (BANNER) diretamente no buffer
+    binário do stdout, evitando a codificação caractere a caractere.
     """
-    # Banner simples em ASCII - TAREFAUTO
-    banner = """
-╔════════════════════════════════════════════════════════════════════════════════╗
-║                                                                                ║
-║  ████████╗ █████╗ ██████╗ ███████╗███████╗ █████╗ ██╗   ██╗████████╗ ██████╗   ║
-║  ╚══██╔══╝██╔══██╗██╔══██╗██╔════╝██╔════╝██╔══██╗██║   ██║╚══██╔══╝██╔═══██╗  ║
-║     ██║   ███████║██████╔╝█████╗  █████╗  ███████║██║   ██║   ██║   ██║   ██║  ║
-║     ██║   ██╔══██║██╔══██╗██╔══╝  ██╔══╝  ██╔══██║██║   ██║   ██║   ██║   ██║  ║
-║     ██║   ██║  ██║██║  ██║███████╗██║     ██║  ██║╚██████╔╝   ██║   ╚██████╔╝  ║
-║     ╚═╝   ╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝╚═╝     ╚═╝  ╚═╝ ╚═════╝    ╚═╝    ╚═════╝   ║
-║                                                                                ║
-║                   🤖 Automação de Tarefas Repetitivas 🤖                       ║
-║                                                                                ║
-║                          Desenvolvido por:                                     ║
-║                          Matheus Laidler                                       ║
-║                https://github.com/matheuslaidler/tarefauto                     ║
-║                                                                                ║
-╚════════════════════════════════════════════════════════════════════════════════╝
-    """
-    print(banner)
+    # O banner já está pronto em bytes UTF-8 (BANNER), então pode ir direto
+    # para o buffer binário do console, sem passar pelo codec de texto.
+    # Só fazemos isso quando o console é UTF-8; caso contrário (ex: cp1252
+    # no Windows, ou stdout substituído sem .buffer) usamos print() normal.
+    encoding = (getattr(sys.stdout, "encoding", None) or "").lower().replace("-", "")
+    buffer = getattr(sys.stdout, "buffer", None)
+    
+    if buffer is not None and encoding == "utf8":
+        sys.stdout.flush()  # Garante a ordem com o que já foi impresso
+        buffer.write(BANNER)
+        buffer.flush()
+    else:
+        print(BANNER.decode("utf-8"), end="")
 
 
-def main() -> int:
+# Resultado do pré-carregamento da interface (preenchido por _preload_gui)
+_gui_preload = {}
+
+
+def _preload_gui() -> None:
     """
-    Função principal - ponto de entrada do programa.
+    Importa o módulo da janela principal em segundo plano.
     
     EXPLICAÇÃO PARA INICIANTES:
-    Esta é a função que "roda tudo". Ela:
-    1. Mostra o banner de boas-vindas
-    2. Verifica se tudo está instalado corretamente
-    3. Inicia a interface gráfica
+    Carregar a interface (customtkinter, tkinter, Pillow...) é a parte
+    mais demorada da inicialização. Enquanto as verificações rodam e
+    você lê o banner, esta função já vai adiantando esse carregamento.
+    
+    EXPLICAÇÃO TÉCNICA:
+    Executada em uma thread daemon. Apenas IMPORTA os módulos - importar
+    tkinter fora da thread principal é seguro; criar widgets não é, por
+    isso a janela continua sendo criada em _launch_gui(), na thread
+    principal. Erros são ignorados aqui: _launch_gui() refaz a importação
+    e mostra a mensagem de erro completa.
+    """
+    try:
+        from src.gui.main_window import MainWindow
+        _gui_preload["MainWindow"] = MainWindow
+    except Exception:
+        pass
+
+
+def _launch_gui(preload_thread: "threading.Thread | None" = None) -> int:
+    """
+    Cria a janela principal e executa o loop da interface.
     
+    EXPLICAÇÃO PARA INICIANTES:
+    Abre a janela do TarefAuto e fica esperando até você fechá-la.
     Se algo der errado, mostra uma mensagem explicando o problema.
     
     EXPLICAÇÃO TÉCNICA:
-    Entry point que realiza verificações e inicia a aplicação.
-    Retorna código de saída (0 = sucesso, 1 = erro).
+    Separado de main() para que o executável (PyInstaller) possa pular
+    direto para cá, sem as verificações de ambiente.
+    
+    Args:
+        preload_thread: Thread de _preload_gui(), se foi iniciada.
+            Esperamos ela terminar antes de criar a janela.
     
     Returns:
         int: Código de saída (0 = sucesso, 1 = erro)
     """
-    # Mostra o banner
-    show_startup_banner()
-    
-    print("Iniciando verificações...")
-    print("")
-    
-    # ========================================================================
-    # VERIFICAÇÃO 1: Versão do Python
-    # ========================================================================
-    
-    print("[1/3] Verificando versão do Python...", end=" ")
-    if not check_python_version():
-        return 1
-    print(f"✅ Python {sys.version_info[0]}.{sys.version_info[1]}")
-    
-    # ========================================================================
-    # VERIFICAÇÃO 2: Dependências
-    # ========================================================================
-    
-    print("[2/3] Verificando dependências...", end=" ")
-    if not check_dependencies():
-        return 1
-    print("✅ Todas instaladas")
-    
-    # ========================================================================
-    # VERIFICAÇÃO 3: Plataforma
-    # ========================================================================
-    
-    print("[3/3] Verificando plataforma...", end=" ")
-    check_platform_compatibility()
-    print(f"✅ {platform.system()}")
-    
-    print("")
-    print("=" * 60)
-    print("Iniciando interface gráfica...")
-    print("=" * 60)
-    print("")
-    
-    # ========================================================================
-    # INICIA A APLICAÇÃO
-    # ========================================================================
-    
     try:
-        # Importa aqui (lazy import) para só carregar depois das verificações
-        from src.gui.main_window import MainWindow
+        # Aguarda o pré-carregamento (se houver) e usa o resultado dele
+        if preload_thread is not None:
+            preload_thread.join()
+        MainWindow = _gui_preload.get("MainWindow")
+        
+        if MainWindow is None:
+            # Importa aqui (lazy import) para só carregar depois das verificações
+            from src.gui.main_window import MainWindow
         
         # Cria a janela principal
         app = MainWindow()
@@ -339,18 +418,18 @@ def main() -> int:
         app.mainloop()
         
         print("")
-        print("=" * 60)
+        print(_SEP)
         print("TarefAuto encerrado. Até a próxima! 👋")
-        print("=" * 60)
+        print(_SEP)
         
         return 0  # Sucesso
         
     except Exception as e:
         # Algum erro inesperado aconteceu
         print("")
-        print("=" * 60)
+        print(_SEP)
         print("❌ ERRO INESPERADO!")
-        print("=" * 60)
+        print(_SEP)
         print(f"")
         print(f"Ocorreu um erro ao iniciar o TarefAuto:")
         print(f"")
@@ -361,7 +440,7 @@ def main() -> int:
         print(f"")
         print(f"Inclua a mensagem de erro acima e descreva o que você")
         print(f"estava fazendo quando o erro aconteceu.")
-        print("=" * 60)
+        print(_SEP)
         
         # Para debug, imprime o traceback completo
         import traceback
@@ -371,6 +450,84 @@ def main() -> int:
         return 1  # Erro
 
 
+def main() -> int:
+    """
+    Função principal - ponto de entrada do programa.
+    
+    EXPLICAÇÃO PARA INICIANTES:
+    Esta é a função que "roda tudo". Ela:
+    1. Mostra o banner de boas-vindas
+    2. Verifica se tudo está instalado corretamente
+    3. Inicia a interface gráfica
+    
+    Se algo der errado, mostra uma mensagem explicando o problema.
+    
+    EXPLICAÇÃO TÉCNICA:
+    Entry point que realiza verificações e inicia a aplicação.
+    Retorna código de saída (0 = sucesso, 1 = erro).
+    
+    Returns:
+        int: Código de saída (0 = sucesso, 1 = erro)
+    """
+    # Mostra o banner
+    show_startup_banner()
+    
+    # No executável gerado pelo PyInstaller (sys.frozen), as dependências
+    # e a versão do Python já vêm embutidas - as verificações seriam só
+    # custo extra na inicialização. Vai direto para a interface.
+    if getattr(sys, "frozen", False):
+        return _launch_gui()
+    
+    # ========================================================================
+    # VERIFICAÇÕES
+    # ========================================================================
+    # Executamos todas as verificações primeiro e só depois mostramos um
+    # resumo único. Cada print() é uma escrita separada no console (muito
+    # lenta no Windows), então juntamos tudo em uma só escrita.
+    # Se alguma verificação falhar, ela mesma já mostra a mensagem de erro.
+    
+    # VERIFICAÇÃO 1: Versão do Python
+    if not check_python_version():
+        return 1
+    
+    # Com a versão do Python confirmada, já começa a carregar a interface
+    # em segundo plano enquanto as outras verificações rodam
+    preload_thread = threading.Thread(
+        target=_preload_gui,
+        name="TarefAuto-PreloadGUI",
+        daemon=True
+    )
+    preload_thread.start()
+    
+    # VERIFICAÇÃO 2: Dependências
+    if not check_dependencies():
+        return 1
+    
+    # VERIFICAÇÃO 3: Plataforma (apenas mostra avisos, nunca falha)
+    check_platform_compatibility()
+    
+    summary = (
+        "Verificações concluídas:\n"
+        "\n"
+        f"[1/3] Python {sys.version_info.major}.{sys.version_info.minor} ✅\n"
+        "[2/3] Dependências instaladas ✅\n"
+        f"[3/3] Plataforma {_SYSTEM} ✅\n"
+        "\n"
+        f"{_SEP}\n"
+        "Iniciando interface gráfica...\n"
+        f"{_SEP}\n"
+        "\n"
+    )
+    sys.stdout.write(summary)
+    sys.stdout.flush()
+    
+    # ========================================================================
+    # INICIA A APLICAÇÃO
+    # ========================================================================
+    
+    return _launch_gui(preload_thread)
+
+
 # ============================================================================
 # EXECUÇÃO
 # ============================================================================
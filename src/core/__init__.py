@@ -24,11 +24,20 @@ e gerenciamento de hotkeys para automação de tarefas.
 """
 
 # Importações expostas no nível do pacote para facilitar o uso
-# Quando alguém fizer "from src.core import X", esses itens estarão disponíveis
-from src.core.events import InputEvent, RecordingSession
-from src.core.recorder import Recorder
-from src.core.player import Player
-from src.core.hotkeys import HotkeyManager
+# Quando alguém fizer "from src.core import X", esses itens estarão disponíveis.
+#
+# Os módulos só são importados quando o nome é acessado pela primeira vez
+# (PEP 562: __getattr__ de módulo). Assim, quem precisa apenas de
+# src.core.events não paga o custo de carregar o pynput (recorder, player,
+# hotkeys) durante a inicialização.
+# Formato: nome exportado -> módulo onde ele está definido
+_LAZY_IMPORTS = {
+    "InputEvent": "src.core.events",
+    "RecordingSession": "src.core.events",
+    "Recorder": "src.core.recorder",
+    "Player": "src.core.player",
+    "HotkeyManager": "src.core.hotkeys",
+}
 
 # __all__ define explicitamente o que é exportado quando alguém usa
 # "from src.core import *" - isso é uma boa prática de segurança
@@ -39,3 +48,27 @@ __all__ = [
     "Player",            # Classe responsável por reproduzir ações
     "HotkeyManager",     # Classe que gerencia atalhos de teclado globais
 ]
+
+
+def __getattr__(name):
+    """
+    Importa sob demanda os itens exportados pelo pacote (PEP 562).
+    
+    EXPLICAÇÃO TÉCNICA:
+    Chamado pelo Python apenas quando o atributo não existe no módulo.
+    Depois da primeira importação, o objeto é guardado em globals(),
+    então os acessos seguintes não passam mais por aqui.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache: próximos acessos são diretos
+    return value
+
+
+def __dir__():
+    """Inclui os nomes carregados sob demanda no dir() do pacote."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,253 @@
+# ============================================================================
+# TarefAuto - Espera de Alta Precisão (_precise_wait.py)
+# ============================================================================
+#
+# EXPLICAÇÃO PARA INICIANTES:
+# Durante a reprodução, cada evento tem uma "hora marcada". Este módulo
+# faz a thread esperar até essa hora com a maior precisão possível,
+# sem ficar gastando CPU à toa e sem deixar de atender um pedido de parada.
+#
+# EXPLICAÇÃO TÉCNICA:
+# A espera tem duas partes. A maior parte é um Event.wait(), que acorda
+# na hora se a reprodução for parada. Os últimos ~0.3 ms ficam com um
+# timer do sistema com prazo absoluto: clock_nanosleep no Linux, timer
+# de alta resolução (CreateWaitableTimerExW) no Windows. Nos dois casos
+# a chamada via ctypes libera o GIL. Sem nenhum deles (ex: macOS), o
+# final da espera é um laço que consulta o relógio.
+#
+# ============================================================================
+
+"""
+Espera até um prazo absoluto com precisão de sub-milissegundo.
+
+Módulo interno do Player (não é exportado por src.core).
+
+Functions:
+    prepare_thread: Ajusta a thread atual para esperas curtas
+    wait_until: Espera até um instante de time.perf_counter()
+
+Dependencies:
+    - ctypes: Para os timers de alta precisão do sistema (opcional)
+    - threading: O Event de parada da reprodução
+
+Autor: Matheus Laidler
+GitHub: https://github.com/matheuslaidler/tarefauto
+"""
+
+# ============================================================================
+# IMPORTAÇÕES
+# ============================================================================
+
+# sys: Para escolher o backend de acordo com o sistema
+import sys
+
+# threading: Tipo do Event de parada
+import threading
+
+# time: perf_counter é o relógio de todos os prazos
+import time
+
+# typing: Anotações de tipo
+from typing import Callable, Optional
+
+
+# ============================================================================
+# CONSTANTES
+# ============================================================================
+
+# Últimos segundos de cada espera entregues ao timer preciso (~0.3 ms)
+# Event.wait acorda com atraso (até ~15 ms no Windows, dezenas de
+# microssegundos no Linux); o fim da espera fica com o backend.
+TAIL_S = 3e-4
+
+
+# ============================================================================
+# BACKENDS
+# ============================================================================
+
+def _spin_until(deadline: float) -> None:
+    """
+    Espera ativa: consulta o relógio até o prazo (último recurso).
+    
+    Args:
+        deadline: Instante de time.perf_counter()
+    """
+    perf_counter = time.perf_counter
+    while perf_counter() < deadline:
+        pass
+
+
+def _linux_backend() -> Optional[Callable[[float], None]]:
+    """
+    Cria o backend clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME).
+    
+    EXPLICAÇÃO TÉCNICA:
+    Só é usado se perf_counter for o próprio CLOCK_MONOTONIC (padrão no
+    Linux): o prazo em segundos vira um timespec absoluto nesse relógio,
+    sem conversão. EINTR (sinal) apenas repete a chamada.
+    
+    Returns:
+        Função sleep_until(deadline) ou None se indisponível
+    """
+    if "CLOCK_MONOTONIC" not in time.get_clock_info("perf_counter").implementation:
+        return None
+    
+    try:
+        import ctypes
+        import ctypes.util
+        
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        clock_nanosleep = libc.clock_nanosleep
+    except (OSError, AttributeError):
+        return None
+    
+    class _Timespec(ctypes.Structure):
+        _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+    
+    clock_nanosleep.argtypes = [
+        ctypes.c_int, ctypes.c_int,
+        ctypes.POINTER(_Timespec), ctypes.POINTER(_Timespec),
+    ]
+    clock_nanosleep.restype = ctypes.c_int
+    
+    CLOCK_MONOTONIC = 1
+    TIMER_ABSTIME = 1
+    EINTR = 4
+    
+    def sleep_until(deadline: float) -> None:
+        seconds = int(deadline)
+        request = _Timespec(seconds, int((deadline - seconds) * 1e9))
+        while clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME, ctypes.byref(request), None) == EINTR:
+            pass
+    
+    return sleep_until
+
+
+def _windows_backend() -> Optional[Callable[[float], None]]:
+    """
+    Cria o backend com timer de alta resolução do Windows 10 1803+.
+    
+    EXPLICAÇÃO TÉCNICA:
+    CreateWaitableTimerExW com CREATE_WAITABLE_TIMER_HIGH_RESOLUTION
+    não depende do "tick" de ~15.6 ms do sistema. O prazo é convertido
+    em tempo relativo (unidades de 100 ns, negativo = relativo). Um
+    único timer é usado: só a thread de reprodução chama wait_until.
+    
+    Returns:
+        Função sleep_until(deadline) ou None se indisponível
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+        
+        kernel32 = ctypes.windll.kernel32
+        kernel32.CreateWaitableTimerExW.restype = wintypes.HANDLE
+        kernel32.SetWaitableTimer.argtypes = [
+            wintypes.HANDLE, ctypes.POINTER(ctypes.c_longlong), wintypes.LONG,
+            ctypes.c_void_p, ctypes.c_void_p, wintypes.BOOL,
+        ]
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    except (OSError, AttributeError):
+        return None
+    
+    CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+    TIMER_ALL_ACCESS = 0x1F0003
+    INFINITE = 0xFFFFFFFF
+    
+    timer = kernel32.CreateWaitableTimerExW(
+        None, None, CREATE_WAITABLE_TIMER_HIGH_RESOLUTION, TIMER_ALL_ACCESS
+    )
+    if not timer:
+        return None  # Windows antigo: sem alta resolução
+    
+    perf_counter = time.perf_counter
+    
+    def sleep_until(deadline: float) -> None:
+        remaining = deadline - perf_counter()
+        if remaining <= 0:
+            return
+        due = ctypes.c_longlong(-int(remaining * 1e7))
+        if kernel32.SetWaitableTimer(timer, ctypes.byref(due), 0, None, None, False):
+            kernel32.WaitForSingleObject(timer, INFINITE)
+        else:
+            _spin_until(deadline)
+    
+    return sleep_until
+
+
+def _select_backend() -> Callable[[float], None]:
+    """
+    Escolhe o melhor backend disponível neste sistema.
+    
+    Returns:
+        Função sleep_until(deadline)
+    """
+    backend = None
+    if sys.platform.startswith("linux"):
+        backend = _linux_backend()
+    elif sys.platform == "win32":
+        backend = _windows_backend()
+    return backend or _spin_until
+
+
+# Backend escolhido uma vez, na importação
+_sleep_until = _select_backend()
+
+
+# ============================================================================
+# FUNÇÕES PÚBLICAS
+# ============================================================================
+
+def prepare_thread() -> None:
+    """
+    Ajusta a thread atual para acordar no horário exato.
+    
+    EXPLICAÇÃO TÉCNICA:
+    No Linux, o kernel pode atrasar de propósito o fim de uma espera em
+    até 50 us ("timer slack") para agrupar despertares. PR_SET_TIMERSLACK
+    = 1 ns desliga isso só para a thread que chama - por isso deve ser
+    chamada de dentro da thread de reprodução. Nos outros sistemas não
+    faz nada.
+    
+    Returns:
+        None
+    """
+    if not sys.platform.startswith("linux") or _sleep_until is _spin_until:
+        return
+    try:
+        import ctypes
+        import ctypes.util
+        
+        PR_SET_TIMERSLACK = 29
+        libc = ctypes.CDLL(ctypes.util.find_library("c"))
+        libc.prctl(PR_SET_TIMERSLACK, 1, 0, 0, 0)
+    except (OSError, AttributeError):
+        pass
+
+
+def wait_until(deadline: float, stop_flag: threading.Event) -> bool:
+    """
+    Espera até o instante deadline, ou até stop_flag ser ligado.
+    
+    EXPLICAÇÃO PARA INICIANTES:
+    "Dorme" até a hora marcada do próximo evento. Se você mandar parar
+    a reprodução no meio da espera, ela termina na hora.
+    
+    EXPLICAÇÃO TÉCNICA:
+    Até TAIL_S antes do prazo: stop_flag.wait() (acorda com stop()).
+    O resto: _sleep_until (timer do sistema ou espera ativa), que não
+    é interrompível - a parada pode atrasar no máximo TAIL_S.
+    
+    Args:
+        deadline: Instante de time.perf_counter()
+        stop_flag: Event ligado quando a reprodução deve parar
+    
+    Returns:
+        bool: True se a espera foi interrompida por stop_flag
+    """
+    coarse = deadline - time.perf_counter() - TAIL_S
+    if coarse > 0 and stop_flag.wait(timeout=coarse):
+        return True
+    
+    _sleep_until(deadline)
+    return stop_flag.is_set()
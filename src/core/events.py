@@ -44,28 +44,227 @@ from dataclasses import dataclass, field
 
 # typing: Módulo para anotações de tipo, ajuda IDEs e desenvolvedores a
 # entenderem que tipo de dados cada variável deve conter
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Iterable
 
-# Enum: Classe base para criar enumerações (conjuntos fixos de valores)
+# IntEnum: Enumeração cujos membros também são inteiros
 # Por exemplo: dias da semana, tipos de eventos, etc.
-from enum import Enum, auto
+from enum import IntEnum
 
-# json: Módulo para converter dados Python para JSON e vice-versa
-# JSON é um formato de texto usado para salvar/carregar dados
-import json
+# sys: Usado para verificar a versão do Python (suporte a slots)
+import sys
 
-# time: Módulo para trabalhar com tempo (timestamps, delays, etc.)
-import time
+# array: Vetores compactos de números (como uma lista, mas cada item ocupa
+# só os bytes do número, sem um objeto Python por item). Módulo embutido
+# e leve - usado para exportar os eventos em colunas (ver to_arrays)
+from array import array
 
-# datetime: Módulo para trabalhar com datas e horas formatadas
-from datetime import datetime
+# struct: Converte números para bytes em formato fixo (prefixo do formato binário)
+import struct
+
+# attrgetter/chain: percorrem atributos e sequências em C, sem laço Python
+from operator import attrgetter
+from itertools import chain
+
+# json e datetime são importados dentro das funções que os usam
+# (save/load e criação da data). Eventos são criados o tempo todo durante
+# a gravação, mas serialização só acontece ao salvar/carregar - assim
+# "import src.core.events" fica leve e não atrasa a inicialização.
+
+
+def _json_codec():
+    """
+    Escolhe as funções de conversão JSON (texto <-> dicionário).
+    
+    EXPLICAÇÃO PARA INICIANTES:
+    Se a biblioteca opcional "orjson" estiver instalada, usamos ela
+    (bem mais rápida para gravações grandes). Se não, usamos o módulo
+    json que já vem com o Python. O arquivo gerado é o mesmo JSON.
+    
+    EXPLICAÇÃO TÉCNICA:
+    Import local (só ao salvar/carregar). As duas funções trabalham com
+    bytes em UTF-8, então o arquivo é aberto em modo binário.
+    
+    dumps(obj, pretty=False) gera JSON compacto, sem espaços nem quebras
+    de linha. No módulo json padrão isso mantém o codificador em C
+    (com indent, versões antigas do Python usam o codificador em Python
+    puro, bem mais lento).
+    
+    Returns:
+        tuple: (dumps(obj, pretty=True) -> bytes, loads(bytes) -> obj)
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        
+        def dumps(obj: Any, pretty: bool = True) -> bytes:
+            # indent=2: fica legível; ensure_ascii=False: mantém acentos
+            if pretty:
+                text = json.dumps(obj, indent=2, ensure_ascii=False)
+            else:
+                text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+            return text.encode("utf-8")
+        
+        return dumps, json.loads
+    
+    def dumps(obj: Any, pretty: bool = True) -> bytes:
+        if pretty:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return orjson.dumps(obj)
+    
+    return dumps, orjson.loads
+
+
+def _intern_str(value: Any) -> Any:
+    """
+    Devolve uma cópia compartilhada do texto (ou o valor sem mudança).
+    
+    EXPLICAÇÃO PARA INICIANTES:
+    Ao carregar um arquivo, cada "left" ou "a" lido vira um texto novo
+    na memória - 100 mil cliques são 100 mil cópias de "left". Com
+    sys.intern() todos passam a apontar para o mesmo texto.
+    
+    EXPLICAÇÃO TÉCNICA:
+    Usado nos campos button/key, que têm poucos valores distintos.
+    Além de economizar ~50 bytes por evento, comparações entre textos
+    internados (ex: event.button == 'left') acertam já pela identidade.
+    Valores que não são str (None ou JSON editado à mão) passam direto.
+    
+    Args:
+        value: Texto a internar, ou qualquer outro valor
+    
+    Returns:
+        O texto internado, ou o próprio valor se não for str
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+# Último resultado de _now_iso(): [instante (time.monotonic), texto ISO]
+_now_iso_cache: List[Any] = [float("-inf"), ""]
+
+
+def _now_iso() -> str:
+    """
+    Retorna a data/hora atual no formato ISO 8601.
+    
+    EXPLICAÇÃO TÉCNICA:
+    Import local de datetime para manter o módulo leve no carregamento.
+    
+    O texto é reaproveitado por até 1 segundo: criar várias sessões em
+    sequência (ex: Recorder.start, from_dict em lote) não monta um
+    datetime novo a cada vez. A janela é medida com time.monotonic,
+    que não é afetado por ajustes no relógio do sistema.
+    
+    Returns:
+        str: Data/hora atual, ex: "2026-01-02T10:30:00.123456"
+    """
+    from time import monotonic
+    now = monotonic()
+    cache = _now_iso_cache
+    if now - cache[0] >= 1.0:
+        from datetime import datetime
+        cache[1] = datetime.now().isoformat()
+        cache[0] = now
+    return cache[1]
+
+
+# Argumentos extras para @dataclass em classes criadas em grande quantidade.
+# slots=True (Python 3.10+) remove o __dict__ de cada instância: menos
+# memória por evento e acesso direto aos atributos. No Python 3.8/3.9 o
+# parâmetro não existe, e __slots__ manual não funciona com campos que têm
+# valor padrão - então nessas versões a classe continua sem slots.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Valor usado nas colunas numéricas de to_arrays() no lugar de None
+# (um array de inteiros não pode guardar None). É o menor int de 32 bits,
+# impossível como coordenada de tela ou passo de scroll.
+COLUMN_NONE = -(2 ** 31)
+
+
+def _number_column(values: List[Any]) -> array:
+    """
+    Monta uma coluna numérica (x, y, dx, dy) de to_arrays().
+    
+    EXPLICAÇÃO TÉCNICA:
+    Usa array 'i' (4 bytes por item) quando todos os valores são
+    inteiros, o caso normal. Se algum não for (o pynput informa
+    coordenadas float no macOS, e um JSON editado à mão pode trazer
+    10.7), a coluna inteira vira 'd' em vez de truncar o valor - o
+    typecode vai no cabeçalho do .tarefa, então a leitura não muda.
+    
+    Args:
+        values: Valores da coluna, com COLUMN_NONE no lugar de None
+    
+    Returns:
+        array: Coluna 'i' ou, se preciso, 'd'
+    """
+    try:
+        return array('i', values)
+    except (TypeError, OverflowError):
+        return array('d', values)
+
+
+def _intern_column(values: List[Optional[str]]) -> "tuple[array, List[Optional[str]]]":
+    """
+    Codifica uma coluna de textos repetidos como números pequenos.
+    
+    EXPLICAÇÃO PARA INICIANTES:
+    Botões e teclas se repetem muito ('left', 'left', 'a', 'a'...).
+    Em vez de guardar o texto em cada posição, guardamos uma tabela
+    com cada texto uma única vez e, na coluna, só o índice na tabela.
+    
+    EXPLICAÇÃO TÉCNICA:
+    Dictionary encoding: o índice 0 da tabela é sempre None, então
+    eventos sem valor ficam com código 0. dict.fromkeys() acha os
+    valores distintos (mantendo a ordem) num laço feito em C; o laço
+    em Python só passa pelos poucos valores distintos.
+    
+    Args:
+        values: Valores da coluna (textos ou None)
+    
+    Returns:
+        tuple: (array 'H' com os códigos, tabela código -> texto)
+    """
+    table: List[Optional[str]] = list(dict.fromkeys(chain((None,), values)))
+    codes = {value: code for code, value in enumerate(table)}
+    return array('H', [codes[value] for value in values]), table
+
+
+# Colunas opcionais do formato colunar de to_dict(columnar=True):
+# (chave no JSON, atributo do InputEvent). A ordem segue os campos do
+# InputEvent depois de timestamp/event_type - from_dict depende disso.
+_OPTIONAL_COLUMNS = (
+    ("x", "x"),
+    ("y", "y"),
+    ("btn", "button"),
+    ("pressed", "pressed"),
+    ("key", "key"),
+    ("dx", "dx"),
+    ("dy", "dy"),
+)
+
+
+# Formato binário de gravação (ver RecordingSession.save_bin):
+# extensão usada por save()/GUI e assinatura no início do arquivo.
+BINARY_EXTENSION = ".tarefa"
+_BINARY_MAGIC = b"TAREFAUTO-BIN\x00"
+
+# Versão do layout binário. Aumente ao mudar o formato, para que versões
+# antigas do programa recusem o arquivo em vez de ler dados errados.
+_BINARY_FORMAT_VERSION = 1
+
+# Prefixo de tamanho fixo do arquivo binário, empacotado com struct (em C):
+# assinatura (14 bytes), versão do formato (uint16) e tamanho do
+# cabeçalho JSON (uint32), tudo little-endian ("<").
+_BINARY_PREFIX = struct.Struct("<14sHI")
 
 
 # ============================================================================
 # ENUMERAÇÃO DE TIPOS DE EVENTO
 # ============================================================================
 
-class EventType(Enum):
+class EventType(IntEnum):
     """
     Enumeração dos tipos de eventos que podem ser capturados.
     
@@ -80,7 +279,11 @@ class EventType(Enum):
     
     EXPLICAÇÃO TÉCNICA:
     Enum garante type-safety e permite que IDEs ofereçam autocomplete.
-    O método auto() gera valores únicos automaticamente para cada membro.
+    Como IntEnum, cada membro é um int de verdade: comparações como
+    event.event_type == EventType.MOUSE_MOVE viram comparação de inteiros
+    (feita em C), e EventType(2) recupera o membro em O(1). Os valores são
+    fixos e explícitos porque podem ser gravados em arquivo - nunca
+    renumere os membros existentes.
     
     Attributes:
         MOUSE_MOVE: Movimento do cursor do mouse
@@ -90,21 +293,32 @@ class EventType(Enum):
         KEY_RELEASE: Tecla solta no teclado
     """
     
-    # auto() gera um valor inteiro único automaticamente
     # Cada tipo representa uma ação diferente que o usuário pode fazer
+    # Os valores são fixos (não usamos auto()) para nunca mudarem
     
-    MOUSE_MOVE = auto()     # Valor: 1 - Quando o mouse se move na tela
-    MOUSE_CLICK = auto()    # Valor: 2 - Quando um botão do mouse é clicado
-    MOUSE_SCROLL = auto()   # Valor: 3 - Quando a rodinha do mouse gira
-    KEY_PRESS = auto()      # Valor: 4 - Quando uma tecla é pressionada
-    KEY_RELEASE = auto()    # Valor: 5 - Quando uma tecla é solta
+    MOUSE_MOVE = 1      # Quando o mouse se move na tela
+    MOUSE_CLICK = 2     # Quando um botão do mouse é clicado
+    MOUSE_SCROLL = 3    # Quando a rodinha do mouse gira
+    KEY_PRESS = 4       # Quando uma tecla é pressionada
+    KEY_RELEASE = 5     # Quando uma tecla é solta
+
+
+# Tabelas de conversão EventType <-> texto, montadas uma única vez.
+# event_type.name e EventType["..."] passam pela maquinaria do Enum a cada
+# chamada; ao salvar/carregar milhares de eventos, um dicionário simples
+# é bem mais rápido.
+# _EVENT_TYPE_NAME: membro -> nome ("MOUSE_MOVE")
+# _EVENT_TYPE_FROM_RAW: nome ou valor numérico (como aparece no JSON) -> membro
+_EVENT_TYPE_NAME: Dict[EventType, str] = {m: m.name for m in EventType}
+_EVENT_TYPE_FROM_RAW: Dict[Union[str, int], EventType] = {m.name: m for m in EventType}
+_EVENT_TYPE_FROM_RAW.update({m.value: m for m in EventType})
 
 
 # ============================================================================
 # CLASSE DE EVENTO DE ENTRADA
 # ============================================================================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class InputEvent:
     """
     Representa um único evento de entrada (mouse ou teclado).
@@ -122,6 +336,9 @@ class InputEvent:
     como __init__, __repr__, __eq__ baseado nos atributos definidos.
     Isso reduz código boilerplate e torna a classe mais limpa.
     
+    Uma gravação pode ter dezenas de milhares de eventos, por isso a
+    classe usa __slots__ quando disponível (ver _DATACLASS_SLOTS).
+    
     Attributes:
         timestamp (float): Momento em que o evento ocorreu (segundos desde início)
         event_type (EventType): Tipo do evento (mouse_move, key_press, etc.)
@@ -223,11 +440,13 @@ class InputEvent:
         # Usamos nomes curtos ('t' em vez de 'timestamp') para economizar espaço
         data = {
             "t": self.timestamp,                    # 't' = timestamp (tempo)
-            "type": self.event_type.name,           # 'type' = tipo do evento (como string)
+            "type": _EVENT_TYPE_NAME[self.event_type],  # 'type' = tipo do evento (como string)
         }
         
         # Adiciona campos opcionais APENAS se eles tiverem valor
         # Isso mantém o JSON limpo, sem campos desnecessários
+        # (os "if" escritos um a um são mais rápidos que um laço sobre uma
+        # lista de campos com getattr - medido: o laço é ~2x mais lento)
         
         if self.x is not None:                      # Se tem coordenada X
             data["x"] = self.x
@@ -282,9 +501,10 @@ class InputEvent:
             >>> event.x
             100
         """
-        # Converte a string do tipo de volta para o enum EventType
-        # EventType["MOUSE_MOVE"] retorna EventType.MOUSE_MOVE
-        event_type = EventType[data["type"]]
+        # Converte o tipo de volta para o enum EventType
+        # "MOUSE_MOVE" -> EventType.MOUSE_MOVE
+        # Também aceita o valor numérico: 1 -> EventType.MOUSE_MOVE
+        event_type = _EVENT_TYPE_FROM_RAW[data["type"]]
         
         # Cria e retorna uma nova instância de InputEvent
         # .get() retorna None se a chave não existir no dicionário
@@ -293,14 +513,21 @@ class InputEvent:
             event_type=event_type,                  # Pega o tipo (já convertido)
             x=data.get("x"),                        # Pega X ou None
             y=data.get("y"),                        # Pega Y ou None
-            button=data.get("btn"),                 # Pega botão ou None
+            button=_intern_str(data.get("btn")),    # Pega botão ou None
             pressed=data.get("pressed"),            # Pega estado ou None
-            key=data.get("key"),                    # Pega tecla ou None
+            key=_intern_str(data.get("key")),       # Pega tecla ou None
             dx=data.get("dx"),                      # Pega scroll X ou None
             dy=data.get("dy"),                      # Pega scroll Y ou None
         )
 
 
+# Campos da sessão lidos por RecordingSession.from_dict: chaves do topo do
+# dicionário e chaves dentro de "settings". Campos ausentes no arquivo
+# ficam com o valor padrão definido na própria dataclass.
+_SESSION_KEYS = ("version", "name", "description", "created_at")
+_SETTINGS_KEYS = ("record_mouse", "record_keyboard")
+
+
 # ============================================================================
 # CLASSE DE SESSÃO DE GRAVAÇÃO
 # ============================================================================
@@ -354,8 +581,8 @@ class RecordingSession:
     events: List[InputEvent] = field(default_factory=list)
     
     # Data e hora de criação - preenchido automaticamente
-    # datetime.now().isoformat() gera algo como "2026-01-02T10:30:00"
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    # _now_iso() gera algo como "2026-01-02T10:30:00"
+    created_at: str = field(default_factory=_now_iso)
     
     # Configurações de gravação - por padrão, grava tudo
     record_mouse: bool = True       # Gravar ações do mouse?
@@ -387,6 +614,24 @@ class RecordingSession:
         """
         self.events.append(event)  # append adiciona ao final da lista
 
+    def add_events(self, events: Iterable[InputEvent]) -> None:
+        """
+        Adiciona vários eventos de uma vez, na ordem recebida.
+        
+        EXPLICAÇÃO PARA INICIANTES:
+        Igual ao add_event(), mas para um grupo de eventos. Em vez de
+        chamar add_event() mil vezes, chamamos add_events() uma vez só.
+        
+        EXPLICAÇÃO TÉCNICA:
+        list.extend() copia todos os itens em C e aumenta a lista de
+        uma vez só, sem uma chamada de método Python por evento. Usado
+        pelo Recorder para descarregar os eventos acumulados.
+        
+        Args:
+            events (Iterable[InputEvent]): Eventos a serem adicionados
+        """
+        self.events.extend(events)
+
     def clear_events(self) -> None:
         """
         Remove todos os eventos gravados.
@@ -417,31 +662,130 @@ class RecordingSession:
         Retorna o timestamp do último evento, que representa a duração
         total desde o início da gravação (timestamp=0).
         
+        A GUI chama este método várias vezes por segundo durante a
+        gravação: ler o último item da lista já é O(1). Como events é
+        uma lista pública (pode ser alterada diretamente), o valor é
+        sempre lido dela em vez de guardado à parte, para nunca ficar
+        desatualizado.
+        
         Returns:
             float: Duração em segundos, ou 0.0 se não houver eventos
         """
-        # Se não há eventos, duração é zero
-        if not self.events:  # Lista vazia é "falsy" em Python
-            return 0.0
+        events = self.events
+        return events[-1].timestamp if events else 0.0
+
+    @property
+    def duration(self) -> float:
+        """Duração total da gravação em segundos (o mesmo que get_duration())."""
+        return self.get_duration()
+
+    def to_arrays(self) -> Dict[str, Any]:
+        """
+        Exporta os eventos em colunas (um array por campo).
+        
+        EXPLICAÇÃO PARA INICIANTES:
+        A lista de eventos é como uma tabela guardada linha por linha.
+        Este método entrega a mesma tabela coluna por coluna: todos os
+        tempos juntos, todos os X juntos, e assim por diante. Para
+        contas sobre um campo só (ex: somar tempos) isso é bem mais
+        rápido e ocupa muito menos memória.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Structure of Arrays com array.array: cada coluna é um bloco
+        contíguo de números, sem um objeto Python por item. Campos
+        ausentes viram COLUMN_NONE (x, y, dx, dy), -1 (pressed) ou o
+        código 0 (btn, key - ver _intern_column). A lista de eventos
+        continua sendo o armazenamento principal; as colunas são uma
+        cópia feita sob demanda.
+        
+        Returns:
+            Dict[str, Any]: Colunas "t" ('d'), "type" ('b'), "x", "y",
+            "dx", "dy" ('i', ou 'd' se algum valor não for inteiro - ver
+            _number_column), "pressed" ('b'), "btn", "key" ('H') e as
+            tabelas "btn_table" e "key_table" para decodificar btn/key
+        """
+        events = self.events
+        none = COLUMN_NONE
+        
+        btn_codes, btn_table = _intern_column([e.button for e in events])
+        key_codes, key_table = _intern_column([e.key for e in events])
         
-        # Retorna o timestamp do último evento da lista
-        return self.events[-1].timestamp  # [-1] acessa o último elemento
+        return {
+            "t": array('d', [e.timestamp for e in events]),
+            "type": array('b', [e.event_type for e in events]),
+            "x": _number_column([none if e.x is None else e.x for e in events]),
+            "y": _number_column([none if e.y is None else e.y for e in events]),
+            "dx": _number_column([none if e.dx is None else e.dx for e in events]),
+            "dy": _number_column([none if e.dy is None else e.dy for e in events]),
+            "pressed": array('b', [-1 if e.pressed is None else e.pressed for e in events]),
+            "btn": btn_codes,
+            "key": key_codes,
+            "btn_table": btn_table,
+            "key_table": key_table,
+        }
 
-    def to_dict(self) -> Dict[str, Any]:
+    def timestamps(self) -> memoryview:
         """
-        Converte a sessão completa para um dicionário.
+        Retorna os tempos de todos os eventos, em ordem, somente leitura.
         
         EXPLICAÇÃO PARA INICIANTES:
-        Assim como InputEvent tem seu to_dict(), a sessão também precisa
-        ser convertida para dicionário para poder ser salva em arquivo.
-        Este método converte TUDO: as configurações E todos os eventos.
+        Útil para perguntas sobre o tempo sem percorrer os eventos um a
+        um. Ex: "qual o primeiro evento depois de 10 segundos?" pode ser
+        respondido com bisect.bisect_left(session.timestamps(), 10.0).
         
         EXPLICAÇÃO TÉCNICA:
-        Serializa recursivamente a sessão e todos os eventos contidos
-        para um formato compatível com JSON.
+        memoryview somente leitura sobre um array 'd' (ver to_arrays).
+        É uma cópia tirada no momento da chamada - eventos adicionados
+        depois não aparecem. Funciona com len(), índices, fatias,
+        bisect, sum() e .tolist().
         
         Returns:
-            Dict[str, Any]: Dicionário com todos os dados da sessão
+            memoryview: Timestamps (float) de todos os eventos
+        """
+        return memoryview(array('d', [e.timestamp for e in self.events])).toreadonly()
+
+    def event_types(self) -> memoryview:
+        """
+        Retorna o tipo (valor numérico de EventType) de cada evento.
+        
+        EXPLICAÇÃO TÉCNICA:
+        memoryview somente leitura sobre um array 'b', na mesma ordem de
+        timestamps(). Ex: session.event_types().tolist().count(EventType.MOUSE_MOVE)
+        
+        Returns:
+            memoryview: Valores de EventType (int) de todos os eventos
+        """
+        return memoryview(array('b', [e.event_type for e in self.events])).toreadonly()
+
+    def xy(self) -> "tuple[memoryview, memoryview]":
+        """
+        Retorna as colunas de coordenadas X e Y de todos os eventos.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Duas memoryviews somente leitura sobre arrays 'i' (ou 'd', ver
+        _number_column), na mesma ordem de timestamps(). Eventos sem
+        posição (teclado) têm COLUMN_NONE.
+        São duas colunas separadas porque memoryview de duas dimensões
+        não aceita indexação por linha.
+        
+        Returns:
+            tuple: (xs, ys)
+        """
+        events = self.events
+        none = COLUMN_NONE
+        xs = _number_column([none if e.x is None else e.x for e in events])
+        ys = _number_column([none if e.y is None else e.y for e in events])
+        return memoryview(xs).toreadonly(), memoryview(ys).toreadonly()
+
+    def _metadata_dict(self) -> Dict[str, Any]:
+        """
+        Monta o dicionário com os dados da sessão, exceto os eventos.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Parte comum de to_dict() e do cabeçalho de save_bin().
+        
+        Returns:
+            Dict[str, Any]: Versão, nome, descrição, data e configurações
         """
         return {
             "version": self.version,                                    # Versão do formato
@@ -452,9 +796,58 @@ class RecordingSession:
                 "record_mouse": self.record_mouse,                      # Gravou mouse?
                 "record_keyboard": self.record_keyboard,                # Gravou teclado?
             },
-            "events": [event.to_dict() for event in self.events],       # Lista de eventos (convertidos)
         }
 
+    def to_dict(self, columnar: bool = False) -> Dict[str, Any]:
+        """
+        Converte a sessão completa para um dicionário.
+        
+        EXPLICAÇÃO PARA INICIANTES:
+        Assim como InputEvent tem seu to_dict(), a sessão também precisa
+        ser convertida para dicionário para poder ser salva em arquivo.
+        Este método converte TUDO: as configurações E todos os eventos.
+        
+        Por padrão cada evento vira um bloco próprio (fácil de editar à
+        mão). Com columnar=True os eventos são guardados em colunas -
+        muito mais rápido para gravações longas, mas menos legível.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Serializa recursivamente a sessão e todos os eventos contidos
+        para um formato compatível com JSON.
+        
+        No formato colunar, "events" dá lugar a "n" (número de eventos)
+        e "columns" (uma lista por campo). Colunas opcionais que não têm
+        nenhum valor são omitidas. Em vez de N dicionários com vários
+        "if" cada, são só ~9 listas montadas por list comprehension.
+        
+        Args:
+            columnar (bool): Se True, usa o formato colunar
+        
+        Returns:
+            Dict[str, Any]: Dicionário com todos os dados da sessão
+        """
+        data = self._metadata_dict()
+        events = self.events
+        
+        if not columnar:
+            data["events"] = [event.to_dict() for event in events]      # Lista de eventos (convertidos)
+            return data
+        
+        columns = {
+            "t": [e.timestamp for e in events],
+            "type": list(map(_EVENT_TYPE_NAME.__getitem__, map(attrgetter("event_type"), events))),
+        }
+        n = len(events)
+        for key, attr in _OPTIONAL_COLUMNS:
+            values = list(map(attrgetter(attr), events))
+            # count() roda em C: a coluna só entra se tiver algum valor
+            if values.count(None) != n:
+                columns[key] = values
+        
+        data["n"] = n
+        data["columns"] = columns
+        return data
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RecordingSession":
         """
@@ -467,7 +860,8 @@ class RecordingSession:
         
         EXPLICAÇÃO TÉCNICA:
         Deserializa recursivamente os dados JSON de volta para objetos
-        Python, recriando todos os InputEvents contidos.
+        Python, recriando todos os InputEvents contidos. Aceita os dois
+        formatos de to_dict(): por evento ("events") e colunar ("columns").
         
         Args:
             data (Dict[str, Any]): Dicionário com os dados da sessão
@@ -478,21 +872,168 @@ class RecordingSession:
         # Extrai as configurações do dicionário
         settings = data.get("settings", {})  # Pega settings ou dict vazio
         
-        # Converte cada dicionário de evento de volta para InputEvent
-        events = [InputEvent.from_dict(e) for e in data.get("events", [])]
+        # Só repassa os campos presentes no arquivo; os ausentes usam o
+        # padrão da dataclass (ex: created_at usa _now_iso(), que assim só
+        # é chamado quando o arquivo não tem a data de criação)
+        fields = {key: data[key] for key in _SESSION_KEYS if key in data}
+        for key in _SETTINGS_KEYS:
+            if key in settings:
+                fields[key] = settings[key]
+        
+        columns = data.get("columns")
+        if columns is None:
+            # Converte cada dicionário de evento de volta para InputEvent
+            events = [InputEvent.from_dict(e) for e in data.get("events", [])]
+        else:
+            # Formato colunar: monta todos os eventos de uma vez, passando
+            # as colunas como argumentos posicionais (ordem dos campos)
+            n = data.get("n", len(columns["t"]))
+            missing = [None] * n
+            types = list(map(_EVENT_TYPE_FROM_RAW.__getitem__, columns["type"]))
+            optional = []
+            for key, _ in _OPTIONAL_COLUMNS:
+                col = columns.get(key, missing)
+                if (key == "btn" or key == "key") and col is not missing:
+                    col = list(map(_intern_str, col))
+                optional.append(col)
+            events = list(map(InputEvent, columns["t"], types, *optional))
         
         # Cria e retorna a sessão reconstruída
-        return cls(
-            version=data.get("version", "1.0.0"),
-            name=data.get("name", "Gravação sem nome"),
-            description=data.get("description", ""),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            record_mouse=settings.get("record_mouse", True),
-            record_keyboard=settings.get("record_keyboard", True),
-            events=events,
-        )
+        return cls(events=events, **fields)
+
+    def save_bin(self, filepath: str) -> bool:
+        """
+        Salva a sessão de gravação em formato binário compacto.
+        
+        EXPLICAÇÃO PARA INICIANTES:
+        O JSON é ótimo para ler e editar, mas repete nomes de campos e
+        escreve cada número como texto. Para gravações longas, o formato
+        binário gera arquivos bem menores e salva/carrega muito mais
+        rápido. Não dá para editar em um editor de texto.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Layout do arquivo:
+        1. _BINARY_PREFIX (struct): _BINARY_MAGIC, versão do formato
+           e tamanho do cabeçalho
+        2. Cabeçalho JSON UTF-8: dados da sessão, "n", "byteorder",
+           "columns" ([chave, typecode, tamanho do item] na ordem em
+           que aparecem) e as tabelas "btn_table"/"key_table"
+        3. Bytes brutos de cada coluna de to_arrays() (array.tobytes)
+        
+        Colunas opcionais sem nenhum valor não são gravadas.
+        
+        Args:
+            filepath (str): Caminho completo onde o arquivo será salvo
+        
+        Returns:
+            bool: True se salvou com sucesso, False se houve erro
+        """
+        try:
+            dumps, _ = _json_codec()
+            arrays = self.to_arrays()
+            n = len(self.events)
+            
+            # Decide quais colunas têm algum valor
+            present = ["t", "type"]
+            for key, _ in _OPTIONAL_COLUMNS:
+                if key == "btn" or key == "key":
+                    has_values = len(arrays[key + "_table"]) > 1
+                elif key == "pressed":
+                    has_values = arrays[key].count(-1) != n
+                else:
+                    has_values = arrays[key].count(COLUMN_NONE) != n
+                if has_values:
+                    present.append(key)
+            
+            header = self._metadata_dict()
+            header["n"] = n
+            header["byteorder"] = sys.byteorder
+            header["columns"] = [
+                [key, arrays[key].typecode, arrays[key].itemsize]
+                for key in present
+            ]
+            header["btn_table"] = arrays["btn_table"]
+            header["key_table"] = arrays["key_table"]
+            header_bytes = dumps(header, pretty=False)
+            
+            with open(filepath, 'wb') as f:
+                f.write(_BINARY_PREFIX.pack(
+                    _BINARY_MAGIC, _BINARY_FORMAT_VERSION, len(header_bytes)
+                ))
+                f.write(header_bytes)
+                for key in present:
+                    f.write(arrays[key].tobytes())
+            return True
+            
+        except Exception as e:
+            print(f"Erro ao salvar gravação: {e}")
+            return False
+
+    @classmethod
+    def _from_bin(cls, content: bytes) -> "RecordingSession":
+        """
+        Reconstrói uma sessão a partir do conteúdo de um arquivo binário.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Lê as colunas com array.frombytes (cópia direta, sem conversão
+        por item), converte os valores sentinela de volta para None e
+        entrega tudo a from_dict() no formato colunar.
+        
+        Args:
+            content (bytes): Conteúdo do arquivo (começa com _BINARY_MAGIC)
+        
+        Returns:
+            RecordingSession: A sessão carregada
+        
+        Raises:
+            ValueError: Se o arquivo estiver incompleto ou incompatível
+        """
+        _, loads = _json_codec()
+        view = memoryview(content)
+        
+        _, version, header_size = _BINARY_PREFIX.unpack_from(view)
+        if version != _BINARY_FORMAT_VERSION:
+            raise ValueError(f"versão do formato binário não suportada: {version}")
+        offset = _BINARY_PREFIX.size
+        data = loads(bytes(view[offset:offset + header_size]))
+        offset += header_size
+        
+        n = data["n"]
+        swap = data.get("byteorder", sys.byteorder) != sys.byteorder
+        none = COLUMN_NONE
+        columns: Dict[str, Any] = {}
+        
+        for key, typecode, itemsize in data["columns"]:
+            col = array(typecode)
+            if col.itemsize != itemsize:
+                raise ValueError(f"coluna '{key}' incompatível com esta plataforma")
+            end = offset + n * itemsize
+            if end > len(content):
+                raise ValueError("arquivo binário incompleto")
+            col.frombytes(view[offset:end])
+            offset = end
+            if swap:
+                col.byteswap()
+            
+            # Volta para o formato de listas com None do to_dict colunar
+            if key == "btn" or key == "key":
+                columns[key] = list(map(data[key + "_table"].__getitem__, col))
+            elif key == "pressed":
+                columns[key] = [None if v < 0 else v == 1 for v in col]
+            elif key == "t" or key == "type":
+                columns[key] = col.tolist()
+            else:
+                columns[key] = [None if v == none else v for v in col]
+        
+        data["columns"] = columns
+        return cls.from_dict(data)
 
-    def save(self, filepath: str) -> bool:
+    def save(
+        self,
+        filepath: str,
+        columnar: bool = False,
+        pretty: Optional[bool] = None
+    ) -> bool:
         """
         Salva a sessão de gravação em um arquivo JSON.
         
@@ -506,11 +1047,20 @@ class RecordingSession:
         
         EXPLICAÇÃO TÉCNICA:
         Serializa a sessão para JSON e escreve no sistema de arquivos.
-        Usa indentação para legibilidade e ensure_ascii=False para
-        suportar caracteres Unicode (acentos, emojis, etc.).
+        Usa indentação para legibilidade e mantém caracteres Unicode
+        (acentos, emojis, etc.) em UTF-8. Usa orjson se disponível
+        (ver _json_codec).
+        
+        Se o caminho terminar em BINARY_EXTENSION (".tarefa"), salva no
+        formato binário de save_bin().
         
         Args:
             filepath (str): Caminho completo onde o arquivo será salvo
+            columnar (bool): Salva os eventos em colunas (ver to_dict)
+            pretty (Optional[bool]): Se True, JSON indentado (legível,
+                bom para editar); se False, JSON compacto (menor e mais
+                rápido). Padrão: indentado, exceto no formato colunar,
+                que não é feito para edição manual
         
         Returns:
             bool: True se salvou com sucesso, False se houve erro
@@ -518,17 +1068,21 @@ class RecordingSession:
         Raises:
             Não levanta exceções - erros são capturados e retorna False
         """
+        if filepath.lower().endswith(BINARY_EXTENSION):
+            return self.save_bin(filepath)
+        
         try:
-            # Abre o arquivo para escrita ('w' = write)
-            # encoding='utf-8' garante suporte a caracteres especiais
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # json.dump converte o dicionário para JSON e escreve no arquivo
-                json.dump(
-                    self.to_dict(),     # O que salvar (nossa sessão como dict)
-                    f,                  # Onde salvar (o arquivo aberto)
-                    indent=2,           # Indentação de 2 espaços (fica bonito)
-                    ensure_ascii=False  # Permite acentos e caracteres especiais
-                )
+            dumps, _ = _json_codec()
+            
+            # Converte a sessão para JSON (bytes em UTF-8)
+            if pretty is None:
+                pretty = not columnar
+            content = dumps(self.to_dict(columnar), pretty)
+            
+            # Abre o arquivo para escrita binária ('wb' = write bytes)
+            # e grava tudo de uma vez
+            with open(filepath, 'wb') as f:
+                f.write(content)
             return True  # Sucesso!
             
         except Exception as e:
@@ -551,6 +1105,9 @@ class RecordingSession:
         EXPLICAÇÃO TÉCNICA:
         Lê o arquivo JSON e deserializa de volta para objetos Python.
         Retorna None em caso de erro para permitir tratamento pelo chamador.
+        O BOM UTF-8 que alguns editores (ex: Bloco de Notas) colocam no
+        início do arquivo é ignorado. Arquivos do formato binário
+        (save_bin) são reconhecidos pela assinatura, não pela extensão.
         
         Args:
             filepath (str): Caminho do arquivo a ser carregado
@@ -559,10 +1116,22 @@ class RecordingSession:
             Optional[RecordingSession]: A sessão carregada, ou None se falhar
         """
         try:
-            # Abre o arquivo para leitura ('r' = read)
-            with open(filepath, 'r', encoding='utf-8') as f:
-                # json.load lê o JSON e converte para dicionário Python
-                data = json.load(f)
+            _, loads = _json_codec()
+            
+            # Abre o arquivo para leitura binária ('rb' = read bytes)
+            with open(filepath, 'rb') as f:
+                content = f.read()
+            
+            # Formato binário (ver save_bin)
+            if content.startswith(_BINARY_MAGIC):
+                return cls._from_bin(content)
+            
+            # Remove o BOM UTF-8, se houver
+            if content.startswith(b"\xef\xbb\xbf"):
+                content = content[3:]
+            
+            # Converte o JSON para dicionário Python
+            data = loads(content)
             
             # Usa from_dict para criar a sessão a partir dos dados
             return cls.from_dict(data)
@@ -580,6 +1149,7 @@ class RecordingSession:
 if __name__ == "__main__":
     # Este bloco só executa se você rodar: python events.py
     # Não executa quando o módulo é importado por outro arquivo
+    import json
     
     print("=== Teste do módulo events.py ===\n")
     
@@ -33,7 +33,8 @@ Classes:
 
 Dependencies:
     - pynput: Para captura de hotkeys globais
-    - threading: Para execução em background
+    - threading: Para a thread que verifica as combinações
+    - concurrent.futures: Para executar os callbacks em background
 
 Autor: Matheus Laidler
 GitHub: https://github.com/matheuslaidler/tarefauto
@@ -43,15 +44,93 @@ GitHub: https://github.com/matheuslaidler/tarefauto
 # IMPORTAÇÕES
 # ============================================================================
 
-# threading: Para executar o listener em thread separada
+# logging: Mensagens de diagnóstico
+# Diferente de print, não escreve nada se ninguém configurou o nível INFO
+# (logging.basicConfig). Assim registrar hotkeys não trava esperando o
+# terminal, e o listener do pynput nunca bloqueia em stdout.
+import logging
+
+# re: Expressão regular que quebra a string da hotkey em teclas
+import re
+
+# threading: Thread de verificação e sinal para acordá-la
 import threading
 
+# time: Relógio monotônico para o intervalo mínimo entre ativações
+import time
+
+# deque: Fila de teclas entre o listener e a thread de verificação
+# (append e popleft são seguros entre threads sem lock)
+from collections import deque
+
 # typing: Anotações de tipo
-from typing import Dict, Callable, Optional, Set
+# TYPE_CHECKING é False durante a execução - o import abaixo dele só é
+# visto por IDEs e verificadores de tipo
+from typing import Any, Dict, Callable, FrozenSet, Optional, Set, Tuple, TYPE_CHECKING
 
 # pynput: Para hotkeys globais
-from pynput import keyboard
-from pynput.keyboard import Key, KeyCode, HotKey
+# Importado só em start(), quando o listener é criado. O pynput carrega
+# as bibliotecas do sistema (X11 no Linux, Quartz no macOS) e demora;
+# assim "import src.core.hotkeys" fica leve e funciona mesmo em máquinas
+# sem interface gráfica, enquanto nenhum listener for iniciado.
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+    from pynput import keyboard
+
+
+# Logger do módulo ("src.core.hotkeys")
+logger = logging.getLogger(__name__)
+
+# Tamanho máximo do cache de _normalize_key. Um teclado tem bem menos
+# teclas que isso; o limite só protege contra crescimento inesperado.
+_NORM_CACHE_MAX = 512
+
+# Teclas especiais que _parse_hotkey escreve com brackets ('f9' -> '<f9>')
+_SPECIAL_KEYS = frozenset({
+    'ctrl', 'shift', 'alt', 'cmd', 'super',
+    'f1', 'f2', 'f3', 'f4', 'f5', 'f6', 'f7', 'f8', 'f9', 'f10', 'f11', 'f12',
+    'escape', 'esc', 'enter', 'return', 'space', 'tab',
+    'backspace', 'delete', 'insert', 'home', 'end', 'page_up', 'page_down',
+    'up', 'down', 'left', 'right', 'caps_lock', 'num_lock', 'scroll_lock',
+    'print_screen', 'pause', 'menu'
+})
+
+# Uma tecla da string de hotkey: '<nome>' ou um trecho sem '<', '>',
+# '+' e espaços (ex: 'r', 'f9'). findall devolve (nome, trecho).
+_HOTKEY_RE = re.compile(r'<([^<>+\s]+)>|([^<>+\s]+)')
+
+# Intervalo mínimo (segundos) entre duas ativações da mesma hotkey
+_HOTKEY_COOLDOWN = 0.3
+
+# Nomes de teclas do pynput (Key.name) que _normalize_key unifica.
+# Teclas fora daqui viram '<nome>' (ex: 'f9' -> '<f9>').
+# _parse_hotkey usa a mesma tabela, então '<ctrl_l>' ou '<esc>' numa
+# hotkey batem com o que o listener produz.
+_KEY_NAME_MAP = {
+    'ctrl': '<ctrl>', 'ctrl_l': '<ctrl>', 'ctrl_r': '<ctrl>',
+    'shift': '<shift>', 'shift_l': '<shift>', 'shift_r': '<shift>',
+    'alt': '<alt>', 'alt_l': '<alt>', 'alt_r': '<alt>', 'alt_gr': '<alt>',
+    'cmd': '<cmd>', 'cmd_l': '<cmd>', 'cmd_r': '<cmd>', 'super': '<cmd>',
+    'esc': '<escape>', 'escape': '<escape>',
+}
+
+
+def _run_callback(callback: Callable[[], None], hotkey: str) -> None:
+    """
+    Executa o callback de uma hotkey e registra no log qualquer erro.
+    
+    EXPLICAÇÃO TÉCNICA:
+    executor.submit() guarda a exceção no Future, que ninguém consulta:
+    sem este envoltório, um erro no callback sumiria sem aviso.
+    
+    Args:
+        callback: Função registrada para a hotkey
+        hotkey: String da hotkey (só para a mensagem de log)
+    """
+    try:
+        callback()
+    except Exception:
+        logger.exception("Erro no callback da hotkey '%s'", hotkey)
 
 
 # ============================================================================
@@ -82,11 +161,13 @@ class HotkeyManager:
     e verificando se alguma combinação configurada foi ativada.
     
     Attributes:
-        _hotkeys (Dict): Mapa de combinação -> callback
-        _pressed_keys (Set): Teclas atualmente pressionadas
+        _hotkeys (Dict): Mapa de combinação -> (teclas, callback)
+        _matcher (Tuple): Hotkeys já interpretadas como máscaras de bits
+        _pressed_mask (int): Teclas de hotkeys atualmente pressionadas
+        _pressed_for (Tuple): _matcher ao qual _pressed_mask se refere
+        _last_fired (Dict): Hotkey -> momento da última ativação
         _listener (Listener): Listener do pynput
         _enabled (bool): Se as hotkeys estão ativadas
-        _lock (Lock): Lock para thread-safety
     
     Example:
         >>> manager = HotkeyManager()
@@ -116,12 +197,49 @@ class HotkeyManager:
         
         # Dicionário que mapeia combinações para funções callback
         # Chave: string da combinação (ex: '<ctrl>+<shift>+r')
-        # Valor: função a ser chamada quando a combinação for pressionada
-        self._hotkeys: Dict[str, Callable[[], None]] = {}
-        
-        # Conjunto de teclas atualmente pressionadas
+        # Valor: (teclas já interpretadas por _parse_hotkey, função a ser
+        #         chamada quando a combinação for pressionada)
+        self._hotkeys: Dict[str, Tuple[FrozenSet[str], Callable[[], None]]] = {}
+        
+        # Resultado de get_registered_hotkeys(), guardado até _hotkeys mudar
+        # (None = precisa montar de novo)
+        self._registered_cache: Optional[Dict[str, str]] = None
+        
+        # Versão "pronta para comparar" de _hotkeys, montada por
+        # _rebuild_combos() sempre que _hotkeys muda. É uma tupla:
+        # - key_index: tecla -> (bit, candidatas), só para teclas usadas
+        #   em alguma hotkey. bit é 1, 2, 4, 8...; candidatas são as
+        #   hotkeys que contêm a tecla, como (máscara com os bits das
+        #   teclas, callback, string da hotkey), na ordem de registro
+        # - min_len: menor número de teclas entre as hotkeys
+        # Fica tudo em um atributo só, trocado de uma vez: a thread de
+        # verificação nunca vê uma versão pela metade.
+        self._matcher: Tuple[
+            Dict[str, Tuple[int, Tuple[Tuple[int, Callable[[], None], str], ...]]],
+            int,
+        ] = ({}, 1)
+        
+        # Cache de _normalize_key: objeto tecla do pynput -> string
+        # As mesmas poucas teclas aparecem o tempo todo; limitado a
+        # _NORM_CACHE_MAX itens para não crescer sem fim
+        self._norm_cache: Dict[Any, str] = {}
+        
+        # Teclas atualmente pressionadas, como máscara de bits (ver _matcher)
         # Usado para detectar combinações (Ctrl+Shift+R, por exemplo)
-        self._pressed_keys: Set[str] = set()
+        # Teclas que não fazem parte de nenhuma hotkey não entram aqui.
+        #
+        # Só a thread de verificação (_match_loop) lê e altera
+        # _pressed_mask, então não precisa de lock. Outras threads
+        # (register_hotkey, stop...) não mexem nele: trocam _matcher ou
+        # zeram _pressed_for, e a verificação percebe no próximo evento
+        # que _pressed_for não é mais o _matcher atual e recomeça do zero
+        # (ver _sync_pressed).
+        self._pressed_mask = 0
+        self._pressed_for: Optional[Tuple] = None
+        
+        # Última ativação de cada hotkey (time.monotonic), também só
+        # usado pela thread de verificação
+        self._last_fired: Dict[str, float] = {}
         
         # ====================================================================
         # LISTENER DO PYNPUT
@@ -129,7 +247,29 @@ class HotkeyManager:
         
         # O listener que observa todas as teclas
         # Será criado quando start() for chamado
-        self._listener: Optional[keyboard.Listener] = None
+        self._listener: Optional["keyboard.Listener"] = None
+        
+        # Classes Key e KeyCode do pynput, guardadas por start()
+        # _normalize_key_uncached compara type(key) com elas em vez de
+        # sondar atributos; None até o pynput ser importado
+        self._key_cls: Optional[type] = None
+        self._keycode_cls: Optional[type] = None
+        
+        # Fila de (pressionou?, tecla) do listener para _match_loop
+        # O callback do pynput só enfileira e avisa: enquanto ele roda,
+        # o sistema segura a próxima tecla, então o trabalho de verdade
+        # (normalizar, comparar, disparar) fica na thread de verificação.
+        self._events: deque = deque()
+        
+        # Sinal que acorda _match_loop; None quando parado
+        # Cada start() cria um novo (e uma fila nova), e a thread antiga
+        # termina ao ver que o seu não é mais o atual.
+        self._wake: Optional[threading.Event] = None
+        
+        # Threads que executam os callbacks das hotkeys
+        # Criado em start() e encerrado em stop(). As mesmas threads são
+        # reaproveitadas a cada atalho, em vez de criar uma nova por vez.
+        self._executor: Optional["ThreadPoolExecutor"] = None
         
         # ====================================================================
         # ESTADO
@@ -140,13 +280,6 @@ class HotkeyManager:
         
         # Se devemos processar hotkeys (pode ser desativado temporariamente)
         self._processing_enabled = True
-        
-        # ====================================================================
-        # CONTROLE DE THREAD-SAFETY
-        # ====================================================================
-        
-        # Lock para acessar _pressed_keys de forma segura
-        self._lock = threading.Lock()
 
     def _normalize_key(self, key) -> str:
         """
@@ -167,42 +300,100 @@ class HotkeyManager:
         Teclas modificadoras (ctrl, shift, alt) são convertidas para
         versão genérica (sem _l ou _r).
         
+        Chamado a cada tecla pressionada e solta: o resultado fica em
+        _norm_cache (Key e KeyCode do pynput são hasheáveis), e as
+        próximas vezes custam só uma consulta ao dicionário.
+        
         Args:
             key: Objeto tecla do pynput (Key ou KeyCode)
         
         Returns:
             str: Representação normalizada da tecla
         """
+        cache = self._norm_cache
         try:
-            # Se é um caractere normal (letra, número)
-            if hasattr(key, 'char') and key.char is not None:
-                return key.char.lower()  # Retorna em minúsculo
-            
-            # Se é uma tecla especial
-            if hasattr(key, 'name'):
-                name = key.name.lower()
-                
-                # Normaliza variações de teclas modificadoras
-                # ctrl_l e ctrl_r viram apenas ctrl
-                if name.startswith('ctrl'):
-                    return '<ctrl>'
-                elif name.startswith('shift'):
-                    return '<shift>'
-                elif name.startswith('alt'):
-                    return '<alt>'
-                elif name.startswith('cmd') or name.startswith('super'):
-                    return '<cmd>'
-                elif name == 'esc' or name == 'escape':
-                    return '<escape>'
-                else:
-                    return f'<{name}>'
-            
-            return str(key).lower()
+            return cache[key]
+        except (KeyError, TypeError):  # TypeError: objeto não hasheável
+            pass
+        
+        result = self._normalize_key_uncached(key)
+        
+        try:
+            if len(cache) >= _NORM_CACHE_MAX:
+                cache.clear()
+            cache[key] = result
+        except TypeError:
+            pass
+        return result
+
+    def _normalize_key_uncached(self, key) -> str:
+        """
+        Faz a conversão de _normalize_key, sem usar o cache.
+        
+        EXPLICAÇÃO TÉCNICA:
+        O listener do pynput só entrega KeyCode (caracteres) e Key
+        (teclas especiais), então primeiro compara o tipo exato com
+        essas duas classes. Outros objetos caem nas sondagens com
+        getattr.
+        
+        Args:
+            key: Objeto tecla do pynput (Key ou KeyCode)
+        
+        Returns:
+            str: Representação normalizada da tecla
+        """
+        key_type = type(key)
+        
+        # Caractere normal (letra, número); sem char: tecla desconhecida
+        if key_type is self._keycode_cls:
+            char = key.char
+            return char.lower() if char is not None else str(key).lower()
+        
+        # Tecla especial (nomes do enum Key já são minúsculos)
+        if key_type is self._key_cls:
+            name = key.name
+            return _KEY_NAME_MAP.get(name) or f'<{name}>'
+        
+        # Sem try/except: getattr com padrão já cobre objetos sem
+        # char/name, e qualquer outra coisa cai no str() do final
+        
+        # Se é um caractere normal (letra, número)
+        char = getattr(key, 'char', None)
+        if char is not None:
+            return char.lower()  # Retorna em minúsculo
+        
+        # Se é uma tecla especial
+        name = getattr(key, 'name', None)
+        if name is not None:
+            name = name.lower()
             
-        except Exception:
-            return str(key).lower()
+            # Normaliza variações de teclas modificadoras
+            # ctrl_l e ctrl_r viram apenas ctrl
+            return _KEY_NAME_MAP.get(name) or f'<{name}>'
+        
+        return str(key).lower()
 
-    def _check_hotkeys(self) -> None:
+    def _sync_pressed(self, matcher: Tuple) -> int:
+        """
+        Retorna _pressed_mask, zerando-o se ele for de outro _matcher.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Chamado apenas na thread de verificação. Quando as hotkeys mudam,
+        os bits são redistribuídos e o estado antigo não vale mais;
+        stop()/start() forçam o mesmo efeito com _pressed_for = None.
+        
+        Args:
+            matcher: O _matcher em uso neste evento
+        
+        Returns:
+            int: Máscara de teclas pressionadas válida para esse matcher
+        """
+        if self._pressed_for is not matcher:
+            self._pressed_for = matcher
+            self._pressed_mask = 0
+        return self._pressed_mask
+
+    def _check_hotkeys(self, matcher: Tuple, pressed: int, candidates: Tuple) -> None:
         """
         Verifica se alguma hotkey registrada foi ativada.
         
@@ -215,36 +406,98 @@ class HotkeyManager:
         estão pressionadas, a função associada será chamada.
         
         EXPLICAÇÃO TÉCNICA:
-        Itera sobre todas as hotkeys registradas e verifica se todas
-        as teclas da combinação estão no conjunto _pressed_keys.
-        Se sim, executa o callback em uma thread separada para não
-        bloquear o listener.
+        Cada hotkey é uma máscara de bits (ver _matcher). Todas as teclas
+        dela estão pressionadas quando (pressionadas & máscara) == máscara:
+        um AND e uma comparação de inteiros, sem percorrer conjuntos.
+        Só são testadas as hotkeys que contêm a tecla que acabou de
+        descer (candidates): as outras não mudaram desde o último evento.
+        Se bater, executa o callback no pool de threads (_executor)
+        para não bloquear a verificação.
+        
+        Args:
+            matcher: O _matcher em uso neste evento
+            pressed: Máscara de teclas pressionadas agora
+            candidates: Hotkeys que contêm a tecla pressionada
         
         Returns:
             None
         """
-        if not self._processing_enabled:
-            return
+        min_len = matcher[1]
         
-        with self._lock:
-            current_keys = self._pressed_keys.copy()
+        # Poucas teclas de hotkeys pressionadas: nada pode ter sido ativado
+        # (bin().count("1") conta os bits ligados; int.bit_count é 3.10+)
+        if bin(pressed).count("1") < min_len:
+            return
         
-        # Verifica cada hotkey registrada
-        for hotkey_str, callback in self._hotkeys.items():
-            # Parse da string de hotkey para conjunto de teclas
-            required_keys = self._parse_hotkey(hotkey_str)
-            
+        # Verifica cada hotkey que usa a tecla pressionada
+        for mask, callback, hotkey in candidates:
             # Verifica se todas as teclas necessárias estão pressionadas
-            if required_keys and required_keys.issubset(current_keys):
-                # Executa o callback em thread separada para não bloquear
-                # daemon=True garante que não trava o programa ao fechar
-                threading.Thread(target=callback, daemon=True).start()
+            if pressed & mask == mask:
+                # Ativada há pouco: ignora (evita disparos em sequência).
+                # As teclas continuam marcadas - com Ctrl segurado, soltar
+                # e apertar R de novo ativa Ctrl+R outra vez.
+                now = time.monotonic()
+                if now - self._last_fired.get(hotkey, float("-inf")) < _HOTKEY_COOLDOWN:
+                    continue
+                self._last_fired[hotkey] = now
                 
-                # Limpa as teclas para evitar ativações múltiplas
-                with self._lock:
-                    self._pressed_keys.clear()
+                # Executa o callback em outra thread para não bloquear a
+                # verificação (erros vão para o log - ver _run_callback).
+                # Cópia local: stop() pode estar trocando o executor ao
+                # mesmo tempo.
+                executor = self._executor
+                if executor is not None:
+                    try:
+                        executor.submit(_run_callback, callback, hotkey)
+                    except RuntimeError:
+                        pass  # Executor já encerrado por stop()
                 break
 
+    def _rebuild_combos(self) -> None:
+        """
+        Recalcula _matcher a partir de _hotkeys.
+        
+        EXPLICAÇÃO PARA INICIANTES:
+        Cada tecla usada em algum atalho ganha um "interruptor" (bit) em
+        um número inteiro. Um atalho vira o número com os interruptores
+        das suas teclas ligados - comparar números é muito rápido.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Chamado por register_hotkey, unregister_hotkey e clear_hotkeys.
+        As strings já foram interpretadas em register_hotkey; aqui só se
+        distribuem os bits. Os bits mudam, então o estado de teclas
+        pressionadas é zerado junto.
+        """
+        parsed = [
+            (keys, callback, hotkey)
+            for hotkey, (keys, callback) in self._hotkeys.items()
+        ]
+        
+        # sorted: a mesma hotkey recebe sempre os mesmos bits
+        all_keys = sorted(frozenset().union(*(keys for keys, _, _ in parsed)))
+        key_bits = {key: 1 << index for index, key in enumerate(all_keys)}
+        
+        # Índice reverso: tecla -> hotkeys que a contêm
+        # Os bits são distintos, então a soma é igual ao OU entre eles
+        by_key: Dict[str, list] = {key: [] for key in all_keys}
+        for keys, callback, hotkey in parsed:
+            combo = (sum(key_bits[key] for key in keys), callback, hotkey)
+            for key in keys:
+                by_key[key].append(combo)
+        
+        key_index = {
+            key: (key_bits[key], tuple(combos))
+            for key, combos in by_key.items()
+        }
+        min_len = min((len(keys) for keys, _, _ in parsed), default=1)
+        
+        # Uma única atribuição: a verificação vê o matcher antigo ou o novo,
+        # nunca uma mistura (e zera as teclas ao perceber a troca)
+        self._matcher = (key_index, min_len)
+        
+        # A lista de hotkeys mudou
+        self._registered_cache = None
+
     def _parse_hotkey(self, hotkey_str: str) -> Set[str]:
         """
         Converte string de hotkey para conjunto de teclas.
@@ -256,8 +509,9 @@ class HotkeyManager:
         Isso facilita comparar se todas as teclas estão pressionadas.
         
         EXPLICAÇÃO TÉCNICA:
-        Faz parsing da notação de hotkey usando '+' como separador.
-        Normaliza cada parte para formato consistente.
+        Uma única passada de _HOTKEY_RE (em C) encontra as teclas; '+'
+        e espaços ficam de fora. Nomes especiais, com ou sem brackets,
+        passam por _KEY_NAME_MAP e ficam no formato de _normalize_key.
         
         Args:
             hotkey_str (str): String da hotkey (ex: '<ctrl>+<shift>+r')
@@ -265,39 +519,15 @@ class HotkeyManager:
         Returns:
             Set[str]: Conjunto de teclas necessárias
         """
-        # Divide pelo separador '+'
-        parts = hotkey_str.lower().split('+')
-        
-        # Lista de teclas especiais que precisam de brackets
-        special_keys = {
-            'ctrl', 'shift', 'alt', 'cmd', 'super',
-            'f1', 'f2', 'f3', 'f4', 'f5', 'f6', 'f7', 'f8', 'f9', 'f10', 'f11', 'f12',
-            'escape', 'esc', 'enter', 'return', 'space', 'tab',
-            'backspace', 'delete', 'insert', 'home', 'end', 'page_up', 'page_down',
-            'up', 'down', 'left', 'right', 'caps_lock', 'num_lock', 'scroll_lock',
-            'print_screen', 'pause', 'menu'
-        }
-        
-        # Normaliza cada parte
         keys = set()
-        for part in parts:
-            part = part.strip()
-            if part:
-                # Remove brackets se existirem para normalizar
-                clean_part = part.strip('<>')
-                
-                # Adiciona brackets se for tecla especial
-                if clean_part in special_keys:
-                    # Normaliza 'esc' para 'escape'
-                    if clean_part == 'esc':
-                        clean_part = 'escape'
-                    keys.add(f'<{clean_part}>')
-                elif part.startswith('<') and part.endswith('>'):
-                    # Já está com brackets
-                    keys.add(part)
-                else:
-                    # Tecla normal (letra, número)
-                    keys.add(part)
+        for name, plain in _HOTKEY_RE.findall(hotkey_str.lower()):
+            if plain and plain not in _SPECIAL_KEYS:
+                # Tecla normal (letra, número)
+                keys.add(plain)
+            else:
+                # Tecla especial: '<f9>' ou 'f9' viram '<f9>'
+                name = name or plain
+                keys.add(_KEY_NAME_MAP.get(name) or f'<{name}>')
         
         return keys
 
@@ -307,32 +537,124 @@ class HotkeyManager:
         
         EXPLICAÇÃO PARA INICIANTES:
         Toda vez que você aperta qualquer tecla, esta função é chamada.
-        Ela adiciona a tecla à nossa lista de "teclas pressionadas agora"
-        e verifica se alguma combinação foi completada.
+        Ela só anota a tecla numa fila e avisa a thread de verificação,
+        que faz o resto (ver _handle_press).
         
         EXPLICAÇÃO TÉCNICA:
-        Adiciona a tecla normalizada ao conjunto _pressed_keys e
-        dispara a verificação de hotkeys.
+        Roda na thread do pynput. Enquanto um callback não retorna, o
+        sistema operacional segura a próxima tecla - por isso aqui só há
+        um append na fila e um Event.set().
         
         Args:
             key: Objeto tecla do pynput
         """
-        if not self._enabled:
+        # Desativado ou sem hotkeys: nada pode ser ativado, e nem vale a
+        # pena enfileirar a tecla (o caso comum: usuário só digitando)
+        if not self._enabled or not self._processing_enabled or not self._hotkeys:
+            return
+        
+        wake = self._wake
+        if wake is not None:
+            self._events.append((True, key))
+            wake.set()
+
+    def _on_key_release(self, key) -> None:
+        """
+        Callback chamado quando uma tecla é solta.
+        
+        EXPLICAÇÃO PARA INICIANTES:
+        Igual a _on_key_press: anota a tecla solta e avisa a thread de
+        verificação (ver _handle_release).
+        
+        Args:
+            key: Objeto tecla do pynput
+        """
+        if not self._enabled or not self._processing_enabled or not self._hotkeys:
             return
         
+        wake = self._wake
+        if wake is not None:
+            self._events.append((False, key))
+            wake.set()
+
+    def _match_loop(self, events: deque, wake: threading.Event) -> None:
+        """
+        Laço da thread de verificação: consome a fila de teclas.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Dorme em wake.wait() até o listener enfileirar algo. O clear()
+        vem antes de esvaziar a fila: uma tecla que chegue no meio volta
+        a ligar o sinal, então nada se perde (no máximo uma volta extra
+        com a fila vazia). Termina quando stop() ou um novo start()
+        troca _wake - conferido também a cada tecla, para que duas
+        threads de verificação nunca mexam em _pressed_mask juntas.
+        
+        Args:
+            events: A fila criada pelo start() que iniciou esta thread
+            wake: O sinal criado pelo mesmo start()
+        """
+        while True:
+            wake.wait()
+            wake.clear()
+            
+            while events:
+                if self._wake is not wake:
+                    return
+                pressed, key = events.popleft()
+                # Uma tecla estranha não pode derrubar a thread: sem ela
+                # nenhuma hotkey funcionaria até o próximo start()
+                try:
+                    if pressed:
+                        self._handle_press(key)
+                    else:
+                        self._handle_release(key)
+                except Exception:
+                    logger.exception("Erro ao processar tecla %r", key)
+            
+            if self._wake is not wake:
+                return
+
+    def _handle_press(self, key) -> None:
+        """
+        Processa uma tecla pressionada (na thread de verificação).
+        
+        EXPLICAÇÃO TÉCNICA:
+        Liga o bit da tecla normalizada em _pressed_mask e, se o bit
+        estava desligado (transição solta -> pressionada), dispara a
+        verificação de hotkeys. Teclas que não fazem parte de nenhuma
+        hotkey não têm bit e são ignoradas logo aqui.
+        
+        Args:
+            key: Objeto tecla do pynput
+        """
         # Normaliza a tecla
         key_str = self._normalize_key(key)
         
-        # Adiciona ao conjunto de teclas pressionadas
-        with self._lock:
-            self._pressed_keys.add(key_str)
+        matcher = self._matcher
+        entry = matcher[0].get(key_str)
+        if entry is None:
+            return  # Tecla fora de qualquer hotkey
+        bit, candidates = entry
+        
+        pressed = self._sync_pressed(matcher)
+        
+        # Segurar uma tecla faz o sistema repetir o "pressionar" várias
+        # vezes (auto-repeat). Só uma tecla que acabou de descer pode
+        # completar uma combinação nova - nas repetições não há o que
+        # verificar.
+        if pressed & bit:
+            return
+        
+        # Marca a tecla como pressionada
+        pressed |= bit
+        self._pressed_mask = pressed
         
         # Verifica se alguma hotkey foi ativada
-        self._check_hotkeys()
+        self._check_hotkeys(matcher, pressed, candidates)
 
-    def _on_key_release(self, key) -> None:
+    def _handle_release(self, key) -> None:
         """
-        Callback chamado quando uma tecla é solta.
+        Processa uma tecla solta (na thread de verificação).
         
         EXPLICAÇÃO PARA INICIANTES:
         Quando você solta uma tecla, ela é removida da nossa lista de
@@ -340,18 +662,21 @@ class HotkeyManager:
         combinações funcionem corretamente.
         
         EXPLICAÇÃO TÉCNICA:
-        Remove a tecla do conjunto _pressed_keys quando é solta.
+        Desliga o bit da tecla em _pressed_mask quando é solta.
         
         Args:
             key: Objeto tecla do pynput
         """
-        if not self._enabled:
-            return
-        
         key_str = self._normalize_key(key)
         
-        with self._lock:
-            self._pressed_keys.discard(key_str)  # discard não dá erro se não existir
+        matcher = self._matcher
+        entry = matcher[0].get(key_str)
+        if entry is None:
+            return  # Tecla fora de qualquer hotkey
+        bit = entry[0]
+        
+        # Desligar um bit já desligado não muda nada
+        self._pressed_mask = self._sync_pressed(matcher) & ~bit
 
     def register_hotkey(self, hotkey: str, callback: Callable[[], None]) -> bool:
         """
@@ -374,8 +699,9 @@ class HotkeyManager:
             register_hotkey('<f5>', reproduzir)
         
         EXPLICAÇÃO TÉCNICA:
-        Adiciona a hotkey ao dicionário interno. A verificação de ativação
-        acontece em _check_hotkeys() quando teclas são pressionadas.
+        Adiciona a hotkey ao dicionário interno e já guarda a versão
+        interpretada (_matcher). A verificação de ativação acontece
+        em _check_hotkeys() quando teclas são pressionadas.
         
         Args:
             hotkey (str): Combinação de teclas (ex: '<ctrl>+<shift>+r')
@@ -391,16 +717,17 @@ class HotkeyManager:
             # Valida que a hotkey pode ser parseada
             keys = self._parse_hotkey(normalized)
             if not keys:
-                print(f"Hotkey inválida: {hotkey}")
+                logger.warning("Hotkey inválida: %s", hotkey)
                 return False
             
             # Registra no dicionário
-            self._hotkeys[normalized] = callback
-            print(f"Hotkey registrada: {hotkey}")
+            self._hotkeys[normalized] = (frozenset(keys), callback)
+            self._rebuild_combos()
+            logger.info("Hotkey registrada: %s", hotkey)
             return True
             
         except Exception as e:
-            print(f"Erro ao registrar hotkey '{hotkey}': {e}")
+            logger.error("Erro ao registrar hotkey '%s': %s", hotkey, e)
             return False
 
     def unregister_hotkey(self, hotkey: str) -> bool:
@@ -424,7 +751,8 @@ class HotkeyManager:
         
         if normalized in self._hotkeys:
             del self._hotkeys[normalized]
-            print(f"Hotkey removida: {hotkey}")
+            self._rebuild_combos()
+            logger.info("Hotkey removida: %s", hotkey)
             return True
         
         return False
@@ -444,7 +772,8 @@ class HotkeyManager:
             None
         """
         self._hotkeys.clear()
-        print("Todas as hotkeys foram removidas")
+        self._rebuild_combos()
+        logger.info("Todas as hotkeys foram removidas")
 
     def start(self) -> bool:
         """
@@ -458,16 +787,49 @@ class HotkeyManager:
         
         EXPLICAÇÃO TÉCNICA:
         Cria e inicia o keyboard.Listener em uma thread daemon.
-        O listener captura todas as teclas e dispara os callbacks.
+        O listener captura todas as teclas e as repassa para a thread de
+        verificação (_match_loop), que dispara os callbacks. Eles
+        rodam em um ThreadPoolExecutor com 2 threads: criar uma Thread
+        nova a cada atalho custa bem mais que reaproveitar uma, e duas
+        permitem que a parada de emergência rode mesmo se outro callback
+        ainda estiver executando.
         
         Returns:
             bool: True se iniciou com sucesso
         """
         if self._enabled:
-            print("Hotkey listener já está rodando!")
+            logger.warning("Hotkey listener já está rodando!")
             return False
         
         try:
+            # Import local: o pynput só é carregado quando realmente
+            # precisamos ouvir o teclado
+            from pynput import keyboard
+            from concurrent.futures import ThreadPoolExecutor
+            
+            self._key_cls = keyboard.Key
+            self._keycode_cls = keyboard.KeyCode
+            
+            # Começa sem teclas pressionadas (ver _sync_pressed)
+            self._pressed_for = None
+            
+            self._executor = ThreadPoolExecutor(
+                max_workers=2,
+                thread_name_prefix="TarefAuto-Hotkey"
+            )
+            
+            # Thread de verificação (daemon: não impede o programa de sair)
+            events: deque = deque()
+            wake = threading.Event()
+            self._events = events
+            self._wake = wake
+            threading.Thread(
+                target=self._match_loop,
+                args=(events, wake),
+                name="TarefAuto-HotkeyMatch",
+                daemon=True
+            ).start()
+            
             # Cria o listener
             self._listener = keyboard.Listener(
                 on_press=self._on_key_press,
@@ -478,11 +840,15 @@ class HotkeyManager:
             self._listener.start()
             
             self._enabled = True
-            print("Hotkey listener iniciado")
+            logger.info("Hotkey listener iniciado")
             return True
             
         except Exception as e:
-            print(f"Erro ao iniciar hotkey listener: {e}")
+            logger.error("Erro ao iniciar hotkey listener: %s", e)
+            self._stop_match_loop()
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
             return False
 
     def stop(self) -> None:
@@ -506,12 +872,37 @@ class HotkeyManager:
             self._listener.stop()
             self._listener = None
         
+        self._stop_match_loop()
+        
+        # Encerra o pool sem esperar: um callback em andamento termina
+        # sozinho, sem travar quem chamou stop()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        
         self._enabled = False
         
-        with self._lock:
-            self._pressed_keys.clear()
+        # A verificação zera as teclas no próximo evento (ver _sync_pressed)
+        self._pressed_for = None
         
-        print("Hotkey listener parado")
+        logger.info("Hotkey listener parado")
+
+    def _stop_match_loop(self) -> None:
+        """
+        Encerra a thread de verificação, se houver uma.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Troca _wake por None e acorda a thread: ela percebe que seu sinal
+        não é mais o atual e sai do laço. Não espera (join): teclas que
+        ainda estejam na fila são simplesmente descartadas.
+        
+        Returns:
+            None
+        """
+        wake = self._wake
+        self._wake = None
+        if wake is not None:
+            wake.set()
 
     def set_enabled(self, enabled: bool) -> None:
         """
@@ -525,12 +916,15 @@ class HotkeyManager:
         
         EXPLICAÇÃO TÉCNICA:
         Apenas define o flag _processing_enabled. O listener continua
-        rodando, mas os callbacks não são executados.
+        rodando, mas ignora as teclas logo na entrada. Enquanto isso as
+        teclas soltas não são vistas, então o estado de teclas
+        pressionadas é descartado (ver _sync_pressed).
         
         Args:
             enabled (bool): True para ativar, False para desativar
         """
         self._processing_enabled = enabled
+        self._pressed_for = None
 
     def is_enabled(self) -> bool:
         """
@@ -557,14 +951,21 @@ class HotkeyManager:
         
         EXPLICAÇÃO TÉCNICA:
         Retorna cópia do dicionário de hotkeys com nomes de callback.
+        O dicionário é montado uma vez e guardado em _registered_cache
+        até a próxima alteração (_rebuild_combos o descarta); cada
+        chamada devolve só uma cópia rasa dele.
         
         Returns:
             Dict[str, str]: Mapa de hotkey -> nome do callback
         """
-        return {
-            hotkey: callback.__name__ if hasattr(callback, '__name__') else str(callback)
-            for hotkey, callback in self._hotkeys.items()
-        }
+        cache = self._registered_cache
+        if cache is None:
+            cache = {
+                hotkey: callback.__name__ if hasattr(callback, '__name__') else str(callback)
+                for hotkey, (_, callback) in self._hotkeys.items()
+            }
+            self._registered_cache = cache
+        return dict(cache)
 
 
 # ============================================================================
@@ -572,7 +973,8 @@ class HotkeyManager:
 # ============================================================================
 
 if __name__ == "__main__":
-    import time
+    # Mostra as mensagens INFO do logger no terminal
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     print("=== Teste do módulo hotkeys.py ===")
     print()
@@ -34,7 +34,7 @@ Classes:
 Dependencies:
     - pynput: Para simulação de eventos de mouse e teclado
     - threading: Para execução assíncrona da reprodução
-    - time: Para controle de timing entre eventos
+    - time: Para controle de timing entre eventos (perf_counter)
 
 Autor: Matheus Laidler
 GitHub: https://github.com/matheuslaidler/tarefauto
@@ -44,6 +44,15 @@ GitHub: https://github.com/matheuslaidler/tarefauto
 # IMPORTAÇÕES
 # ============================================================================
 
+# os: Afinidade de CPU e prioridade da thread (Linux)
+import os
+
+# queue: Entrega das sessões para a thread de reprodução
+import queue
+
+# sys: Para detectar o Windows (resolução do timer do sistema)
+import sys
+
 # threading: Para executar a reprodução em uma thread separada
 # Isso permite que a interface continue funcionando durante a reprodução
 import threading
@@ -51,11 +60,23 @@ import threading
 # time: Para controlar o tempo entre eventos e medir duração
 import time
 
+# deque: Buffer limitado de mensagens de erro da reprodução
+from collections import deque
+
+# array: Vetor compacto de floats (horários dos eventos)
+from array import array
+
+# bisect: Busca binária do último evento dentro do tempo (modo DURATION)
+from bisect import bisect_left
+
+# islice: Percorre só o começo da lista de eventos
+from itertools import islice
+
 # Enum: Para criar enumeração de modos de loop
 from enum import Enum, auto
 
 # typing: Anotações de tipo
-from typing import Optional, Callable, List
+from typing import Any, Dict, Optional, Callable, List, Tuple
 
 # pynput: Controladores para simular mouse e teclado
 from pynput import mouse, keyboard
@@ -64,6 +85,71 @@ from pynput.keyboard import Key, KeyCode
 
 # Importações internas
 from src.core.events import InputEvent, EventType, RecordingSession
+from src.core._precise_wait import prepare_thread, wait_until
+
+
+# ============================================================================
+# PRECISÃO DO TIMING
+# ============================================================================
+
+# A espera entre eventos (sono + timer preciso do sistema) fica em
+# src/core/_precise_wait.py; aqui só o timer de 1 ms do Windows.
+
+# Intervalo mínimo (segundos) entre avisos de progresso para a interface
+# Cada aviso vira uma tarefa na fila da UI; ~30 por segundo já é o
+# máximo que a tela mostra
+_PROGRESS_INTERVAL_S = 0.033
+
+def _set_timer_resolution(enable: bool) -> None:
+    """
+    Liga/desliga o timer de 1 ms do Windows durante a reprodução.
+    
+    EXPLICAÇÃO TÉCNICA:
+    Por padrão o Windows acorda threads a cada ~15.6 ms. timeBeginPeriod(1)
+    reduz isso para 1 ms enquanto ativo; cada chamada precisa de um
+    timeEndPeriod(1) correspondente. Nos outros sistemas não faz nada.
+    
+    Args:
+        enable: True para timeBeginPeriod, False para timeEndPeriod
+    """
+    if sys.platform != "win32":
+        return
+    try:
+        import ctypes
+        winmm = ctypes.windll.winmm
+        if enable:
+            winmm.timeBeginPeriod(1)
+        else:
+            winmm.timeEndPeriod(1)
+    except (OSError, AttributeError):
+        pass  # Sem winmm: fica com a resolução padrão
+
+
+# Janela (segundos) em que movimentos seguidos do mouse viram um só
+# O pynput grava centenas de posições por segundo; mover o cursor para
+# cada uma é uma chamada ao sistema. Dentro da janela só a última
+# posição importa (o caminho visível é o mesmo).
+_MOVE_COALESCE_S = 0.008
+
+# Nomes de botão gravados -> enum Button do pynput
+_BUTTON_MAP = {
+    'left': Button.left,        # Botão esquerdo
+    'right': Button.right,      # Botão direito
+    'middle': Button.middle,    # Botão do meio (rodinha)
+}
+
+# Trava das chamadas aos Controllers do pynput
+# No Python 3.13 o pynput 1.7.x pode quebrar (NotImplementedError,
+# "_ThreadHandle not callable") quando Controllers são usados por mais de
+# uma thread ao mesmo tempo - por exemplo dois Players, ou um Player e
+# outro código do programa. Toda chamada passa por esta trava; ela só
+# é segurada durante a chamada ao sistema e, sem disputa, custa ~100 ns.
+# Qualquer outro código que use Controllers deve usar a mesma trava.
+_PYNPUT_LOCK = threading.Lock()
+
+# Tipos de evento que precisam de um botão/tecla do pynput resolvido
+_CLICK_TYPES = (EventType.MOUSE_CLICK,)
+_KEY_TYPES = (EventType.KEY_PRESS, EventType.KEY_RELEASE)
 
 
 # ============================================================================
@@ -124,7 +210,9 @@ class Player:
     O Player utiliza Controllers do pynput para simular eventos.
     A reprodução ocorre em uma thread separada para não bloquear a UI.
     
-    Implementa parada de emergência via flag thread-safe (_stop_flag).
+    Implementa parada de emergência via número da reprodução ativa
+    (_active_run) e um Event (_stop_flag) que acorda as esperas entre
+    eventos.
     Os eventos são reproduzidos respeitando os deltas de tempo originais.
     
     Attributes:
@@ -135,8 +223,13 @@ class Player:
         _session (RecordingSession): Sessão sendo reproduzida
         _mouse_controller (Controller): Controlador de mouse do pynput
         _keyboard_controller (Controller): Controlador de teclado do pynput
-        _playback_thread (Thread): Thread de reprodução
-        _stop_flag (Event): Flag para parada de emergência
+        _playback_thread (Thread): Thread de reprodução (reaproveitada)
+        _jobs (SimpleQueue): Sessões esperando a thread de reprodução
+        _idle (Event): Ligado quando nenhuma sessão está em reprodução
+        _run_id (int): Número da última reprodução iniciada por play()
+        _active_run (int): Reprodução que pode continuar (0 = nenhuma)
+        _finished_run (int): Última reprodução já finalizada (_finish_run)
+        _stop_flag (Event): Acorda a espera entre eventos ao parar
         _on_progress_callback (Callable): Callback para atualizar progresso
         _on_complete_callback (Callable): Callback quando reprodução termina
     
@@ -148,6 +241,28 @@ class Player:
         >>> player.stop()  # Para imediatamente se necessário
     """
     
+    # Atributos fixos: sem __dict__ por instância. get_current_loop e
+    # get_elapsed_time são chamados pela UI várias vezes por segundo, e a
+    # leitura de um slot é mais direta que a busca num dicionário.
+    # Todo atributo novo do Player precisa ser declarado aqui.
+    __slots__ = (
+        # Configuração e estado público
+        "is_playing", "loop_mode", "loop_value", "_speed", "_inv_speed",
+        "coalesce_moves", "report_errors",
+        # Controladores do pynput
+        "_mouse_controller", "_keyboard_controller", "_handlers", "_key_cache",
+        # Erros e modo tempo real
+        "_err_buf", "_err_count", "_rt_core", "_rt_elevate",
+        # Sessão e thread de reprodução
+        "_session", "_playback_thread", "_jobs", "_idle",
+        "_run_id", "_active_run", "_finished_run", "_stop_flag",
+        # Callbacks
+        "_on_progress_callback", "_on_complete_callback",
+        # Estatísticas
+        "_loops_completed", "_events_played", "_current_loop",
+        "_start_time", "_stats",
+    )
+    
     def __init__(
         self,
         on_progress_callback: Optional[Callable[[int, int, int], None]] = None,
@@ -185,6 +300,9 @@ class Player:
         # Controller de teclado - usado para simular teclas
         self._keyboard_controller = keyboard.Controller()
         
+        # Tipo de evento -> função que o executa (ver _make_handlers)
+        self._handlers = self._make_handlers()
+        
         # ====================================================================
         # ESTADO DE REPRODUÇÃO
         # ====================================================================
@@ -200,7 +318,26 @@ class Player:
         
         # Multiplicador de velocidade (1.0 = velocidade original)
         # Valores menores = mais lento, maiores = mais rápido
-        self.speed_multiplier: float = 1.0
+        # (propriedade: também atualiza _inv_speed)
+        self.speed_multiplier = 1.0
+        
+        # Junta movimentos do mouse muito próximos (ver _MOVE_COALESCE_S)
+        self.coalesce_moves: bool = True
+        
+        # Se erros de eventos são mostrados no terminal ao final
+        self.report_errors: bool = True
+        
+        # Mensagens de erro da reprodução atual
+        # Escrever no terminal no meio da reprodução pode travar a thread
+        # (e atrasar os próximos eventos); as mensagens esperam aqui e
+        # saem todas juntas no final. Guarda só as 256 mais recentes.
+        self._err_buf: deque = deque(maxlen=256)
+        self._err_count = 0
+        
+        # Modo "tempo real" da thread de reprodução (ver set_realtime)
+        # Desligado por padrão: exige permissões e não é preciso no uso comum
+        self._rt_core: Optional[int] = None
+        self._rt_elevate = False
         
         # Sessão sendo reproduzida atualmente
         self._session: Optional[RecordingSession] = None
@@ -210,10 +347,32 @@ class Player:
         # ====================================================================
         
         # Thread onde a reprodução será executada
+        # Criada no primeiro play() e reaproveitada pelos seguintes: fica
+        # parada em _jobs.get() entre uma reprodução e outra
         self._playback_thread: Optional[threading.Thread] = None
         
-        # Event para sinalizar parada de emergência
-        # threading.Event() é thread-safe e pode ser checado de qualquer thread
+        # Fila de reproduções para a thread (None = encerrar a thread)
+        # Cada item: (sessão, número da reprodução, Event de parada)
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        
+        # Ligado enquanto a reprodução atual não está em andamento
+        # (stop() espera por ele)
+        self._idle = threading.Event()
+        self._idle.set()
+        
+        # Parada de emergência
+        # Cada play() ganha um número novo (_run_id). A reprodução só
+        # continua enquanto _active_run for o seu número: stop() zera
+        # _active_run, e um play() seguinte usa outro número - então uma
+        # reprodução parada nunca volta a valer, mesmo que ainda não
+        # tenha terminado. Comparar dois ints é o que o laço faz a cada
+        # evento (mais barato que is_set()).
+        self._run_id = 0
+        self._active_run = 0
+        self._finished_run = 0
+        
+        # Event para acordar a espera entre eventos quando stop() é chamado
+        # Um novo a cada play(): o da reprodução anterior continua ligado
         self._stop_flag = threading.Event()
         
         # ====================================================================
@@ -240,7 +399,15 @@ class Player:
         # Loop atual (para UI)
         self._current_loop = 0
         
-        # Tempo de início da reprodução
+        # Dicionário devolvido por get_stats (reaproveitado a cada chamada)
+        self._stats: Dict[str, Any] = {}
+        
+        # Cache de _get_keyboard_key: texto gravado -> Key/KeyCode
+        # Uma gravação usa poucas teclas diferentes, repetidas muitas vezes
+        self._key_cache: Dict[str, Any] = {}
+        
+        # Tempo de início da reprodução (time.perf_counter: só serve para
+        # medir intervalos, não é hora do relógio)
         self._start_time: float = 0
 
     def set_loop_mode(self, mode: LoopMode, value: float = 1) -> None:
@@ -272,6 +439,97 @@ class Player:
         self.loop_mode = mode
         self.loop_value = value
 
+    def set_realtime(self, core: Optional[int] = None, elevate: bool = True) -> None:
+        """
+        Prende a thread de reprodução a um núcleo e/ou aumenta sua prioridade.
+        
+        EXPLICAÇÃO PARA INICIANTES:
+        O sistema operacional reveza os programas entre os núcleos do
+        processador. Se a reprodução for "pausada" para outro programa
+        bem na hora de um clique, ele sai atrasado. Isto pede ao sistema
+        para dar prioridade à reprodução (útil com velocidades altas).
+        
+        EXPLICAÇÃO TÉCNICA:
+        Aplicado no início de cada reprodução, dentro da própria thread
+        (_apply_realtime). Linux: sched_setaffinity + SCHED_FIFO (exige
+        CAP_SYS_NICE/root). Windows: SetThreadAffinityMask +
+        THREAD_PRIORITY_TIME_CRITICAL. Sem permissão, segue normalmente.
+        A interface (thread principal) não é afetada.
+        
+        Mudar a configuração descarta a thread de reprodução atual (ela
+        termina depois da reprodução em andamento, se houver); o próximo
+        play() cria uma thread nova, sem ajustes antigos.
+        
+        Args:
+            core: Núcleo da CPU (0, 1, 2...) ou None para não fixar
+            elevate: True para aumentar a prioridade da thread
+        """
+        if (core, elevate) == (self._rt_core, self._rt_elevate):
+            return
+        
+        self._rt_core = core
+        self._rt_elevate = elevate
+        
+        # A thread antiga recebe None na fila dela e termina; a próxima
+        # usa uma fila nova (ver _worker_loop)
+        if self._playback_thread is not None:
+            self._jobs.put(None)
+            self._jobs = queue.SimpleQueue()
+            self._playback_thread = None
+
+    def _apply_realtime(self) -> None:
+        """
+        Aplica set_realtime() à thread atual (a de reprodução).
+        
+        A thread é reaproveitada entre reproduções, mas set_realtime()
+        troca a thread quando a configuração muda - então não há nada a
+        desfazer aqui: os ajustes morrem junto com a thread.
+        """
+        core = self._rt_core
+        elevate = self._rt_elevate
+        if core is None and not elevate:
+            return
+        
+        if sys.platform == "win32":
+            try:
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                thread = kernel32.GetCurrentThread()
+                if core is not None:
+                    kernel32.SetThreadAffinityMask(thread, 1 << core)
+                if elevate:
+                    kernel32.SetThreadPriority(thread, 15)  # TIME_CRITICAL
+            except (OSError, AttributeError) as e:
+                print(f"Não foi possível ajustar a thread de reprodução: {e}")
+            return
+        
+        # Linux: pid 0 = a thread que chama
+        if core is not None and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, {core})
+            except OSError as e:
+                print(f"Não foi possível fixar a reprodução no núcleo {core}: {e}")
+        
+        if elevate and hasattr(os, "sched_setscheduler"):
+            try:
+                priority = os.sched_get_priority_max(os.SCHED_FIFO)
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            except OSError as e:  # PermissionError sem CAP_SYS_NICE
+                print(f"Não foi possível aumentar a prioridade da reprodução: {e}")
+
+    @property
+    def speed_multiplier(self) -> float:
+        """Multiplicador de velocidade (1.0 = velocidade original)."""
+        return self._speed
+
+    @speed_multiplier.setter
+    def speed_multiplier(self, value: float) -> None:
+        # Guarda também o inverso: a reprodução multiplica os horários
+        # por ele em vez de dividir pela velocidade (divisão só aqui,
+        # quando a velocidade muda). Valor inválido (<= 0) = normal.
+        self._speed = value
+        self._inv_speed = 1.0 / value if value > 0 else 1.0
+
     def set_speed(self, multiplier: float) -> None:
         """
         Define a velocidade de reprodução.
@@ -288,7 +546,8 @@ class Player:
         
         EXPLICAÇÃO TÉCNICA:
         O multiplicador é aplicado ao delay entre eventos durante a
-        reprodução. Valores < 1 aumentam o delay, > 1 diminuem.
+        reprodução. Valores < 1 aumentam o delay, > 1 diminuem. O
+        inverso (_inv_speed) é calculado aqui, uma vez.
         
         Args:
             multiplier (float): Multiplicador de velocidade (0.1 a 10.0 recomendado)
@@ -296,7 +555,95 @@ class Player:
         # Garante que o multiplicador está em uma faixa razoável
         self.speed_multiplier = max(0.1, min(10.0, multiplier))
 
-    def _execute_event(self, event: InputEvent) -> None:
+    def _prepare(self, events: List[InputEvent]) -> List[Tuple[int, InputEvent, Callable, Any]]:
+        """
+        Resolve antes da reprodução o botão/tecla do pynput de cada evento.
+        
+        EXPLICAÇÃO PARA INICIANTES:
+        Converter 'left' ou 'enter' para o formato do pynput leva um
+        tempinho. Em vez de converter a cada evento (e de novo a cada
+        repetição do loop), convertemos tudo uma vez antes de começar.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Chamado uma vez por play(), não por volta: as N repetições de
+        LoopMode.COUNT reaproveitam a mesma lista. Não é guardado entre
+        plays porque a sessão pode ser editada entre uma e outra.
+        
+        Args:
+            events: Eventos da sessão, na ordem de reprodução
+        
+        Returns:
+            List[Tuple[int, InputEvent, Callable, Any]]: (índice na sessão,
+                evento, função de _make_handlers, Button/Key/KeyCode ou None)
+        """
+        get_button = self._get_mouse_button
+        get_key = self._get_keyboard_key
+        handlers = self._handlers
+        
+        prepared = []
+        for index, event in enumerate(events):
+            event_type = event.event_type
+            handler = handlers.get(event_type)
+            if handler is None:
+                continue  # Tipo desconhecido: não há o que executar
+            
+            # Sem botão/tecla gravado, ou com um valor que não dá para
+            # converter: fica None e o handler tenta resolver na hora - o
+            # erro é reportado só para este evento, sem cancelar o play
+            handle = None
+            try:
+                if event_type in _CLICK_TYPES:
+                    if event.button is not None:
+                        handle = get_button(event.button)
+                elif event_type in _KEY_TYPES:
+                    if event.key is not None:
+                        handle = get_key(event.key)
+            except Exception:
+                handle = None
+            prepared.append((index, event, handler, handle))
+        
+        if self.coalesce_moves:
+            prepared = self._coalesce_moves(prepared)
+        return prepared
+
+    @staticmethod
+    def _coalesce_moves(prepared: List[Tuple[int, InputEvent, Callable, Any]]) -> List[Tuple[int, InputEvent, Callable, Any]]:
+        """
+        Remove movimentos intermediários de sequências rápidas do mouse.
+        
+        EXPLICAÇÃO PARA INICIANTES:
+        Se o mouse passou por 5 posições em 8 milissegundos, basta levar
+        o cursor até a última - ninguém enxerga as do meio.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Agrupa MOUSE_MOVE consecutivos (sem clique/tecla no meio) cujo
+        timestamp fica a menos de _MOVE_COALESCE_S do primeiro do grupo,
+        e mantém só o último. Ele conserva o próprio timestamp, então o
+        tempo total da reprodução não muda.
+        
+        Args:
+            prepared: Saída de _prepare
+        
+        Returns:
+            List: A mesma lista, sem os movimentos intermediários
+        """
+        move = EventType.MOUSE_MOVE
+        result: List[Tuple[int, InputEvent, Callable, Any]] = []
+        group_start: Optional[float] = None  # timestamp do 1º move do grupo
+        
+        for item in prepared:
+            event = item[1]
+            if event.event_type == move:
+                if group_start is not None and event.timestamp - group_start < _MOVE_COALESCE_S:
+                    result[-1] = item  # Substitui o move anterior do grupo
+                    continue
+                group_start = event.timestamp
+            else:
+                group_start = None
+            result.append(item)
+        return result
+
+    def _execute_event(self, event: InputEvent, handle: Any = None) -> None:
         """
         Executa um único evento (move mouse, clica, pressiona tecla, etc.).
         
@@ -312,44 +659,86 @@ class Player:
         
         Args:
             event (InputEvent): O evento a ser executado
+            handle: Botão/tecla já resolvido por _prepare(); se None,
+                é resolvido aqui
+        """
+        # Escolhe a ação baseado no tipo de evento (ver _make_handlers)
+        handler = self._handlers.get(event.event_type)
+        if handler is not None:
+            handler(event, handle)
+
+    def _make_handlers(self) -> Dict[EventType, Callable[[InputEvent, Any], None]]:
         """
-        # Escolhe a ação baseado no tipo de evento
-        event_type = event.event_type
+        Monta a tabela tipo de evento -> função que o executa.
         
-        if event_type == EventType.MOUSE_MOVE:
-            # Move o cursor do mouse para a posição especificada
-            self._mouse_controller.position = (event.x, event.y)
+        EXPLICAÇÃO PARA INICIANTES:
+        Em vez de perguntar "é movimento? é clique? é tecla?..." a cada
+        evento, cada tipo já aponta direto para a função que sabe
+        executá-lo.
         
-        elif event_type == EventType.MOUSE_CLICK:
-            # Clique de mouse
-            # Primeiro, precisamos converter o nome do botão para o enum Button
-            button = self._get_mouse_button(event.button)
-            
-            # Move para a posição do clique (importante!)
-            self._mouse_controller.position = (event.x, event.y)
-            
-            # Executa press ou release dependendo do estado
-            if event.pressed:
-                self._mouse_controller.press(button)    # Pressiona o botão
-            else:
-                self._mouse_controller.release(button)  # Solta o botão
+        EXPLICAÇÃO TÉCNICA:
+        Chamado uma vez no __init__. As funções guardam os controllers e
+        seus métodos em variáveis da closure, sem buscar atributos de
+        self a cada evento. Todas recebem (evento, handle), onde handle é
+        o botão/tecla já resolvido por _prepare() ou None. As chamadas ao
+        pynput acontecem com _PYNPUT_LOCK segurado.
         
-        elif event_type == EventType.MOUSE_SCROLL:
-            # Rolagem do mouse
-            # Move para a posição primeiro
-            self._mouse_controller.position = (event.x, event.y)
-            # Executa o scroll
-            self._mouse_controller.scroll(event.dx, event.dy)
+        Returns:
+            Dict[EventType, Callable]: Função de cada tipo de evento
+        """
+        mc = self._mouse_controller
+        kc = self._keyboard_controller
+        mc_press = mc.press
+        mc_release = mc.release
+        mc_scroll = mc.scroll
+        kc_press = kc.press
+        kc_release = kc.release
+        get_button = self._get_mouse_button
+        get_key = self._get_keyboard_key
+        lock = _PYNPUT_LOCK  # Só em volta das chamadas ao pynput
+        
+        def mouse_move(event: InputEvent, handle: Any) -> None:
+            # Move o cursor do mouse para a posição especificada
+            with lock:
+                mc.position = (event.x, event.y)
         
-        elif event_type == EventType.KEY_PRESS:
-            # Tecla pressionada
-            key = self._get_keyboard_key(event.key)
-            self._keyboard_controller.press(key)
+        def mouse_click(event: InputEvent, handle: Any) -> None:
+            # Primeiro, precisamos do botão no formato do pynput
+            button = handle if handle is not None else get_button(event.button)
+            
+            with lock:
+                # Move para a posição do clique (importante!)
+                mc.position = (event.x, event.y)
+                
+                # Executa press ou release dependendo do estado
+                if event.pressed:
+                    mc_press(button)    # Pressiona o botão
+                else:
+                    mc_release(button)  # Solta o botão
+        
+        def mouse_scroll(event: InputEvent, handle: Any) -> None:
+            # Move para a posição primeiro, depois rola
+            with lock:
+                mc.position = (event.x, event.y)
+                mc_scroll(event.dx, event.dy)
+        
+        def key_press(event: InputEvent, handle: Any) -> None:
+            key = handle if handle is not None else get_key(event.key)
+            with lock:
+                kc_press(key)
+        
+        def key_release(event: InputEvent, handle: Any) -> None:
+            key = handle if handle is not None else get_key(event.key)
+            with lock:
+                kc_release(key)
         
-        elif event_type == EventType.KEY_RELEASE:
-            # Tecla solta
-            key = self._get_keyboard_key(event.key)
-            self._keyboard_controller.release(key)
+        return {
+            EventType.MOUSE_MOVE: mouse_move,
+            EventType.MOUSE_CLICK: mouse_click,
+            EventType.MOUSE_SCROLL: mouse_scroll,
+            EventType.KEY_PRESS: key_press,
+            EventType.KEY_RELEASE: key_release,
+        }
 
     def _get_mouse_button(self, button_name: str) -> Button:
         """
@@ -361,8 +750,9 @@ class Player:
         o formato que o pynput entende. Esta função faz essa conversão.
         
         EXPLICAÇÃO TÉCNICA:
-        Mapeia strings para enum mouse.Button. Usa dicionário para
-        lookup O(1) e retorna left como fallback.
+        Mapeia strings para enum mouse.Button. Usa o dicionário
+        _BUTTON_MAP (montado uma vez) para lookup O(1) e retorna left
+        como fallback.
         
         Args:
             button_name (str): Nome do botão ('left', 'right', 'middle')
@@ -370,15 +760,8 @@ class Player:
         Returns:
             Button: Enum correspondente do pynput
         """
-        # Mapa de nomes para enums
-        button_map = {
-            'left': Button.left,        # Botão esquerdo
-            'right': Button.right,      # Botão direito
-            'middle': Button.middle,    # Botão do meio (rodinha)
-        }
-        
         # Retorna o botão correspondente, ou esquerdo como padrão
-        return button_map.get(button_name.lower(), Button.left)
+        return _BUTTON_MAP.get(button_name.lower(), Button.left)
 
     def _get_keyboard_key(self, key_str: str):
         """
@@ -396,6 +779,7 @@ class Player:
         EXPLICAÇÃO TÉCNICA:
         Tenta encontrar a tecla no enum keyboard.Key (teclas especiais).
         Se não encontrar, assume que é um caractere e cria KeyCode.
+        O resultado fica em _key_cache: cada texto é convertido uma vez.
         
         Args:
             key_str (str): Nome ou caractere da tecla
@@ -403,29 +787,38 @@ class Player:
         Returns:
             Key ou KeyCode: Objeto apropriado para o pynput
         """
+        cached = self._key_cache.get(key_str)
+        if cached is not None:
+            return cached
+        
         # Primeiro, tenta encontrar como tecla especial
         # Teclas especiais: space, enter, tab, shift, ctrl, alt, etc.
-        try:
-            # Key[key_str] busca a tecla pelo nome no enum
-            return Key[key_str]
-        except (KeyError, AttributeError):
-            pass
+        # __members__.get evita criar uma exceção KeyError quando não acha
+        members = Key.__members__
+        key = members.get(key_str)
         
         # Também tenta com letras minúsculas
-        try:
-            return Key[key_str.lower()]
-        except (KeyError, AttributeError):
-            pass
-        
-        # Se não é tecla especial, é um caractere normal
-        # Retorna como KeyCode se for um único caractere
-        if len(key_str) == 1:
-            return KeyCode.from_char(key_str)
+        if key is None:
+            key = members.get(key_str.lower())
+        
+        if key is None:
+            # Se não é tecla especial, é um caractere normal
+            # Retorna como KeyCode se for um único caractere
+            if len(key_str) == 1:
+                key = KeyCode.from_char(key_str)
+            else:
+                # Último recurso: tenta como KeyCode mesmo assim
+                key = KeyCode.from_char(key_str[0]) if key_str else Key.space
         
-        # Último recurso: tenta como KeyCode mesmo assim
-        return KeyCode.from_char(key_str[0]) if key_str else Key.space
+        self._key_cache[key_str] = key
+        return key
 
-    def _playback_loop(self) -> None:
+    def _playback_loop(
+        self,
+        session: RecordingSession,
+        run_id: int,
+        stop_flag: threading.Event
+    ) -> None:
         """
         Loop principal de reprodução (executado em thread separada).
         
@@ -438,25 +831,54 @@ class Player:
         3. Executa o evento (move mouse, clica, digita)
         4. Repete se configurado para fazer loop
         
-        A cada momento, ela verifica se você mandou parar (stop_flag).
+        A cada momento, ela verifica se você mandou parar (_active_run).
         
         EXPLICAÇÃO TÉCNICA:
         Implementa a lógica de reprodução com suporte a diferentes
         modos de loop. Respeita os timestamps originais para timing
-        preciso. Verifica stop_flag regularmente para responsividade.
+        preciso: cada evento é agendado em um prazo absoluto a partir do
+        início da volta, então atrasos de uma espera não se acumulam.
+        Antes de cada evento confere se run_id ainda é a reprodução
+        ativa, para responder rápido a stop().
         
         Esta função não deve ser chamada diretamente - use play().
+        
+        Args:
+            session: Sessão a reproduzir
+            run_id: Número desta reprodução (ver play)
+            stop_flag: Event de parada desta reprodução
         """
         # Verifica se há eventos para reproduzir
-        if not self._session or not self._session.events:
+        if not session or not session.events:
             print("Nenhum evento para reproduzir!")
-            self.is_playing = False
-            if self._on_complete_callback:
-                self._on_complete_callback()
+            self._finish_run(run_id)
             return
         
         # Lista de eventos a reproduzir
-        events = self._session.events
+        events = session.events
+        
+        # Erros da reprodução anterior já foram mostrados
+        self._err_buf.clear()
+        self._err_count = 0
+        
+        # Núcleo/prioridade da thread, se configurado (set_realtime)
+        self._apply_realtime()
+        
+        # Botões e teclas já convertidos para o pynput (uma vez por play)
+        prepared = self._prepare(events)
+        
+        # Horários escalados pela velocidade (montados na primeira volta)
+        offsets = array('d')
+        offsets_inv_speed = 0.0
+        
+        # No Linux, sem "timer slack" nesta thread (o timer de 1 ms do
+        # Windows é ligado por _worker_loop)
+        prepare_thread()
+        
+        # Progresso: índice do último evento reproduzido em cada volta e
+        # horário da última notificação
+        last_index = prepared[-1][0] if prepared else -1
+        last_progress = float('-inf')
         
         # ====================================================================
         # CONFIGURAÇÃO DO LOOP
@@ -476,7 +898,9 @@ class Player:
             max_loops = float('inf')
         
         # Timestamp de início (para modo DURATION e get_elapsed_time)
-        start_time = time.time()
+        # perf_counter é monotônico e de alta resolução: não pula se o
+        # relógio do sistema for ajustado (NTP, horário de verão...)
+        start_time = time.perf_counter()
         self._start_time = start_time
         
         # Contadores
@@ -484,6 +908,13 @@ class Player:
         self._events_played = 0
         self._current_loop = 1
         
+        # Valores que não mudam durante a reprodução, calculados uma vez
+        # (dentro dos laços só se usam estas variáveis locais)
+        total_loops = int(max_loops) if max_loops != float('inf') else -1
+        duration_mode = self.loop_mode == LoopMode.DURATION
+        duration_end = start_time + self.loop_value  # Só no modo DURATION
+        progress_callback = self._on_progress_callback
+        
         # ====================================================================
         # LOOP DE REPRODUÇÃO
         # ====================================================================
@@ -494,90 +925,177 @@ class Player:
             # Atualiza loop atual para UI
             self._current_loop = current_loop + 1
             
-            # Verifica se devemos parar (flag de emergência)
-            if self._stop_flag.is_set():
+            # Verifica se devemos parar (stop() ou um play() mais novo)
+            if self._active_run != run_id:
                 break
             
             # Verifica tempo para modo DURATION
-            if self.loop_mode == LoopMode.DURATION:
-                elapsed = time.time() - start_time
-                if elapsed >= self.loop_value:
-                    break
+            if duration_mode and time.perf_counter() >= duration_end:
+                break
             
             # ================================================================
             # REPRODUZ TODOS OS EVENTOS DA GRAVAÇÃO
             # ================================================================
             
-            # Timestamp do evento anterior (para calcular delay)
-            prev_timestamp = 0.0
+            # Instante em que esta volta começou
+            # Cada evento tem hora marcada: loop_start + timestamp. Assim,
+            # se uma espera atrasar um pouco, o próximo evento compensa
+            # (o atraso não se acumula evento após evento)
+            loop_start = time.perf_counter()
+            
+            # Velocidade lida uma vez por volta, já invertida (1 / velocidade)
+            # Multiplicamos porque queremos: velocidade maior = delay menor
+            inv_speed = self._inv_speed
+            
+            # Horário de cada evento relativo ao início da volta, já com a
+            # velocidade aplicada. Calculado numa passada só e reaproveitado
+            # pelas próximas voltas enquanto a velocidade não mudar
+            if inv_speed != offsets_inv_speed:
+                offsets = array('d', [item[1].timestamp * inv_speed for item in prepared])
+                offsets_inv_speed = inv_speed
+            
+            # Quantos eventos desta volta cabem no tempo (modo DURATION)
+            # Os horários são crescentes: uma busca binária acha de uma vez
+            # o primeiro evento cuja hora marcada passa do fim, em vez de
+            # consultar o relógio antes de cada evento
+            cutoff = len(prepared)
+            if duration_mode:
+                cutoff = bisect_left(offsets, duration_end - loop_start)
             
-            for i, event in enumerate(events):
-                # Verifica stop flag antes de cada evento
-                if self._stop_flag.is_set():
+            for (i, event, handler, handle), offset in islice(zip(prepared, offsets), cutoff):
+                # Verifica parada antes de cada evento
+                if self._active_run != run_id:
                     break
                 
-                # Verifica tempo para modo DURATION
-                if self.loop_mode == LoopMode.DURATION:
-                    elapsed = time.time() - start_time
-                    if elapsed >= self.loop_value:
-                        break
-                
-                # Calcula o delay até este evento
-                # É a diferença de tempo entre este evento e o anterior
-                delay = event.timestamp - prev_timestamp
-                
-                # Aplica o multiplicador de velocidade
-                # Dividimos porque queremos: velocidade maior = delay menor
-                if self.speed_multiplier > 0:
-                    delay = delay / self.speed_multiplier
-                
-                # Espera o tempo necessário
-                # Usamos um loop com pequenos sleeps para checar stop_flag
-                if delay > 0:
-                    sleep_start = time.time()
-                    while time.time() - sleep_start < delay:
-                        # Verifica stop_flag a cada 10ms
-                        if self._stop_flag.is_set():
-                            break
-                        # Dorme no máximo 10ms por vez
-                        remaining = delay - (time.time() - sleep_start)
-                        time.sleep(min(0.01, max(0, remaining)))
-                    
-                    # Se foi interrompido durante o delay
-                    if self._stop_flag.is_set():
-                        break
+                # Espera até a hora marcada deste evento
+                # wait_until dorme em stop_flag.wait() (acorda na hora se
+                # stop() for chamado) e termina com o timer preciso do
+                # sistema; retorna True se foi interrompido
+                deadline = loop_start + offset
+                if deadline > time.perf_counter() and wait_until(deadline, stop_flag):
+                    break
                 
                 # Executa o evento
+                # handler já foi escolhido em _prepare: nenhuma comparação
+                # de tipo aqui
                 try:
-                    self._execute_event(event)
+                    handler(event, handle)
                     self._events_played += 1
                 except Exception as e:
-                    print(f"Erro ao executar evento: {e}")
-                
-                # Atualiza timestamp anterior
-                prev_timestamp = event.timestamp
+                    self._err_count += 1
+                    if self.report_errors:
+                        self._err_buf.append(f"Erro ao executar evento: {e}")
                 
                 # Notifica progresso se callback configurado
-                if self._on_progress_callback:
-                    total_loops = int(max_loops) if max_loops != float('inf') else -1
-                    self._on_progress_callback(current_loop + 1, total_loops, i + 1)
+                # No máximo ~30 vezes por segundo (a tela não atualiza mais
+                # rápido que isso) e sempre no último evento da volta
+                if progress_callback:
+                    now = time.perf_counter()
+                    if i == last_index or now - last_progress >= _PROGRESS_INTERVAL_S:
+                        last_progress = now
+                        progress_callback(current_loop + 1, total_loops, i + 1)
             
             # Incrementa contador de loops (se não foi interrompido)
-            if not self._stop_flag.is_set():
+            if self._active_run == run_id:
                 current_loop += 1
                 self._loops_completed = current_loop
+            
+            # O tempo do modo DURATION acabou no meio desta volta
+            if cutoff < len(prepared):
+                break
         
         # ====================================================================
         # FINALIZAÇÃO
         # ====================================================================
         
+        self._flush_errors()
+        
+        print(f"Reprodução concluída: {self._loops_completed} loops, {self._events_played} eventos")
+        
+        self._finish_run(run_id)
+
+    def _finish_run(self, run_id: int) -> None:
+        """
+        Marca o fim da reprodução run_id e avisa o callback de término.
+        
+        EXPLICAÇÃO TÉCNICA:
+        O estado (is_playing, _idle) é atualizado ANTES do callback: se
+        o callback (ou quem ele acorda) chamar play() de novo, a nova
+        reprodução não tem seu estado desfeito por esta. Se já houve um
+        play() mais novo (run_id não é o último), nada é feito - o
+        estado e o aviso pertencem à reprodução nova. Cada reprodução é
+        finalizada uma vez só: chamar de novo (ex: _worker_loop depois
+        de um erro no próprio callback) não repete o callback.
+        
+        Args:
+            run_id: Número da reprodução que terminou
+        """
+        if run_id != self._run_id or run_id == self._finished_run:
+            return
+        self._finished_run = run_id
+        
         self.is_playing = False
+        self._idle.set()
         
         # Notifica que terminou
         if self._on_complete_callback:
             self._on_complete_callback()
+
+    def _worker_loop(self) -> None:
+        """
+        Corpo da thread de reprodução: reproduz cada sessão recebida.
         
-        print(f"Reprodução concluída: {self._loops_completed} loops, {self._events_played} eventos")
+        EXPLICAÇÃO PARA INICIANTES:
+        Em vez de criar uma thread nova a cada play(), a mesma thread
+        fica esperando a próxima sessão e a reproduz quando chega.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Bloqueia em _jobs.get() (sem gastar CPU). None encerra a thread
+        (ver shutdown). Um erro inesperado numa reprodução não derruba
+        a thread: ela volta a esperar a próxima sessão.
+        """
+        jobs = self._jobs
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            
+            session, run_id, stop_flag = job
+            # Timer de 1 ms do Windows ligado só durante esta reprodução:
+            # o finally garante um timeEndPeriod para cada timeBeginPeriod
+            _set_timer_resolution(True)
+            try:
+                self._playback_loop(session, run_id, stop_flag)
+            except Exception as e:
+                print(f"Erro na reprodução: {e}")
+                self._finish_run(run_id)
+            finally:
+                _set_timer_resolution(False)
+
+    def _flush_errors(self) -> None:
+        """
+        Escreve de uma vez os erros acumulados durante a reprodução.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Uma única chamada a sys.stdout.write em vez de um print por erro.
+        Se houve mais erros do que cabem em _err_buf, avisa quantos
+        ficaram de fora.
+        
+        Returns:
+            None
+        """
+        buffer = self._err_buf
+        if not buffer:
+            return
+        
+        lines = list(buffer)
+        omitted = self._err_count - len(lines)
+        if omitted > 0:
+            lines.insert(0, f"... {omitted} erro(s) anterior(es) omitido(s)")
+        buffer.clear()
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def play(self, session: RecordingSession) -> bool:
         """
@@ -593,7 +1111,9 @@ class Player:
         no botão de parar).
         
         EXPLICAÇÃO TÉCNICA:
-        Cria e inicia uma thread para executar _playback_loop().
+        Entrega a sessão à thread de reprodução (_worker_loop), que
+        executa _playback_loop(). A thread é criada só no primeiro play()
+        (ou se tiver sido encerrada) e reaproveitada nos seguintes.
         Thread daemon=True garante que a thread morre se o programa
         for fechado inesperadamente.
         
@@ -616,19 +1136,29 @@ class Player:
         # Armazena a sessão
         self._session = session
         
-        # Reseta a flag de parada
-        self._stop_flag.clear()
+        # Número e Event de parada novos para esta reprodução
+        # O Event anterior fica ligado: uma reprodução antiga que ainda
+        # não terminou (stop() com timeout) continua parada
+        self._stop_flag.set()
+        stop_flag = self._stop_flag = threading.Event()
+        self._run_id += 1
+        run_id = self._active_run = self._run_id
         
         # Atualiza estado
         self.is_playing = True
+        self._idle.clear()
         
-        # Cria e inicia a thread de reprodução
-        self._playback_thread = threading.Thread(
-            target=self._playback_loop,  # Função a executar
-            name="TarefAuto-Playback",    # Nome para debug
-            daemon=True                   # Morre com o programa principal
-        )
-        self._playback_thread.start()
+        # Cria a thread de reprodução na primeira vez
+        if self._playback_thread is None or not self._playback_thread.is_alive():
+            self._playback_thread = threading.Thread(
+                target=self._worker_loop,  # Função a executar
+                name="TarefAuto-Playback",  # Nome para debug
+                daemon=True                 # Morre com o programa principal
+            )
+            self._playback_thread.start()
+        
+        # Entrega a sessão à thread
+        self._jobs.put((session, run_id, stop_flag))
         
         print(f"Reprodução iniciada: {len(session.events)} eventos")
         return True
@@ -642,13 +1172,14 @@ class Player:
         ela termine naturalmente. É como apertar o botão de "stop"
         de um player de música.
         
-        A parada não é instantânea - pode levar até ~10ms para a
-        reprodução realmente parar (por segurança).
+        A parada é praticamente instantânea: mesmo no meio de uma espera
+        entre eventos, a reprodução acorda e termina.
         
         EXPLICAÇÃO TÉCNICA:
-        Define a flag de parada que é verificada regularmente no
-        _playback_loop(). A thread termina de forma limpa no próximo
-        ciclo de verificação.
+        Zera _active_run (nenhuma reprodução pode continuar) e liga o
+        Event de parada. A espera entre eventos em _playback_loop() é
+        um stop_flag.wait(), que retorna assim que ele é ligado, e a
+        thread termina de forma limpa.
         
         Returns:
             None
@@ -656,16 +1187,38 @@ class Player:
         if not self.is_playing:
             return
         
-        # Seta a flag de parada
+        # Invalida a reprodução atual e acorda a espera em andamento
+        self._active_run = 0
         self._stop_flag.set()
         
-        # Espera a thread terminar (com timeout)
-        if self._playback_thread and self._playback_thread.is_alive():
-            self._playback_thread.join(timeout=1.0)  # Espera até 1 segundo
+        # Espera a reprodução terminar (com timeout)
+        # A thread continua viva, esperando o próximo play()
+        if threading.current_thread() is not self._playback_thread:
+            self._idle.wait(timeout=1.0)  # Espera até 1 segundo
         
         self.is_playing = False
         print("Reprodução interrompida pelo usuário")
 
+    def shutdown(self) -> None:
+        """
+        Para a reprodução e encerra a thread de reprodução.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Opcional (a thread é daemon). Um play() depois disto cria uma
+        thread nova.
+        
+        Returns:
+            None
+        """
+        self.stop()
+        
+        thread = self._playback_thread
+        if thread and thread.is_alive():
+            self._jobs.put(None)
+            if threading.current_thread() is not thread:
+                thread.join(timeout=1.0)
+        self._playback_thread = None
+
     def get_stats(self) -> dict:
         """
         Retorna estatísticas da reprodução atual/última.
@@ -678,18 +1231,22 @@ class Player:
         
         EXPLICAÇÃO TÉCNICA:
         Retorna um dicionário com métricas de estado e progresso.
+        O mesmo dicionário é atualizado e devolvido em toda chamada (sem
+        criar um novo a cada consulta da UI): quem chama não deve
+        alterá-lo, e deve copiá-lo (dict(...)) se quiser guardar os
+        valores de agora.
         
         Returns:
             dict: Dicionário com estatísticas da reprodução
         """
-        return {
-            "is_playing": self.is_playing,
-            "loops_completed": self._loops_completed,
-            "events_played": self._events_played,
-            "loop_mode": self.loop_mode.name,
-            "loop_value": self.loop_value,
-            "speed": self.speed_multiplier,
-        }
+        stats = self._stats
+        stats["is_playing"] = self.is_playing
+        stats["loops_completed"] = self._loops_completed
+        stats["events_played"] = self._events_played
+        stats["loop_mode"] = self.loop_mode.name
+        stats["loop_value"] = self.loop_value
+        stats["speed"] = self.speed_multiplier
+        return stats
 
     def get_current_loop(self) -> int:
         """
@@ -708,7 +1265,7 @@ class Player:
             float: Tempo em segundos
         """
         if self._start_time > 0 and self.is_playing:
-            return time.time() - self._start_time
+            return time.perf_counter() - self._start_time
         return 0.0
 
 
@@ -40,6 +40,15 @@ GitHub: https://github.com/matheuslaidler/tarefauto
 # IMPORTAÇÕES
 # ============================================================================
 
+# os: Afinidade de CPU das threads dos listeners (Linux)
+import os
+
+# queue: Fila de notificações para a interface (ver dispatch_events)
+import queue
+
+# sys: Usado para internar os textos das teclas (sys.intern)
+import sys
+
 # threading: Módulo para trabalhar com múltiplas "linhas de execução"
 # Permite que o programa faça várias coisas ao mesmo tempo
 import threading
@@ -47,8 +56,14 @@ import threading
 # time: Módulo para trabalhar com tempo (medição, delays)
 import time
 
+# array: Buffers compactos dos movimentos do mouse (ver _make_mouse_callbacks)
+from array import array
+
+# attrgetter: Chave de ordenação dos eventos por timestamp
+from operator import attrgetter
+
 # typing: Anotações de tipo para melhor documentação do código
-from typing import Optional, Callable, List
+from typing import Any, Dict, Optional, Callable, List, Tuple
 
 # pynput: Biblioteca principal para captura de mouse e teclado
 # Importamos os módulos de mouse e keyboard separadamente
@@ -59,6 +74,45 @@ from pynput import mouse, keyboard
 from src.core.events import InputEvent, EventType, RecordingSession
 
 
+# Chave para ordenar eventos pelo momento em que aconteceram
+_by_timestamp = attrgetter("timestamp")
+
+# Tipos de evento usados nos callbacks, resolvidos uma vez na importação
+# (EventType.X é uma busca de atributo na classe a cada uso)
+_ET_MOVE = EventType.MOUSE_MOVE
+_ET_CLICK = EventType.MOUSE_CLICK
+_ET_SCROLL = EventType.MOUSE_SCROLL
+_ET_KEY_PRESS = EventType.KEY_PRESS
+_ET_KEY_RELEASE = EventType.KEY_RELEASE
+
+# Botões do pynput -> nome gravado (os que não estão aqui, como os
+# botões laterais, entram no cache na primeira vez que aparecem)
+_BUTTON_NAMES = {
+    mouse.Button.left: 'left',        # Botão esquerdo
+    mouse.Button.right: 'right',      # Botão direito
+    mouse.Button.middle: 'middle',    # Botão do meio (rodinha)
+}
+
+# Filtro de movimentos quase iguais (padrões de update_settings)
+# Um mouse de 1000 Hz gera milhares de movimentos de menos de um pixel
+# que não fazem diferença na reprodução. Um movimento é descartado se
+# vier menos de 8 ms depois do último gravado E estiver a menos de 2 px
+# dele (distância |dx| + |dy|). Cliques, scroll e teclas nunca são
+# descartados.
+_MOVE_COALESCE_DT_MS = 8.0
+_MOVE_COALESCE_DX_PX = 2
+
+# Máximo de notificações esperando dispatch_events()
+# Se a interface não der conta, as notificações excedentes são
+# descartadas - os eventos gravados nunca são.
+_UI_QUEUE_MAX = 10000
+
+# Intervalo mínimo (segundos) entre notificações de movimento do mouse
+# A interface só mostra um contador: avisar de cada movimento não muda
+# nada na tela. Cliques, scroll e teclas são sempre notificados.
+_MOVE_NOTIFY_INTERVAL_S = 0.1
+
+
 # ============================================================================
 # CLASSE RECORDER (GRAVADOR)
 # ============================================================================
@@ -83,14 +137,21 @@ class Recorder:
     
     Os listeners usam o padrão callback: cada vez que um evento ocorre,
     uma função é chamada automaticamente. Esses callbacks registram os
-    eventos na session com timestamps relativos.
+    eventos com timestamps relativos.
+    
+    Durante a gravação os eventos ficam primeiro em um buffer interno
+    (_pending) e passam para a session em lotes - em get_event_count(),
+    flush() e stop(). Assim o callback, que roda a cada movimento do
+    mouse, só faz um append, sem lock. Movimentos nem viram InputEvent
+    na hora: ficam como números em arrays (_move_t, _move_xy) e o
+    InputEvent só é criado no flush.
     
     Attributes:
         session (RecordingSession): Sessão atual contendo os eventos gravados
         record_mouse (bool): Se deve gravar eventos de mouse
         record_keyboard (bool): Se deve gravar eventos de teclado
         is_recording (bool): Estado atual da gravação
-        _start_time (float): Timestamp do início da gravação
+        _start_time (float): Início da gravação (time.perf_counter)
         _mouse_listener (Listener): Listener do pynput para mouse
         _keyboard_listener (Listener): Listener do pynput para teclado
         _on_event_callback (Callable): Callback opcional para notificar eventos
@@ -122,13 +183,20 @@ class Recorder:
         EXPLICAÇÃO TÉCNICA:
         Construtor que inicializa os atributos da instância. O parâmetro
         on_event_callback permite injetar uma função que será chamada
-        cada vez que um evento for capturado (útil para atualizar a UI).
+        para cada evento capturado (útil para atualizar a UI). Ela não
+        roda nas threads do pynput: as notificações esperam numa fila e
+        só são entregues quando alguém chama dispatch_events(), na
+        thread que o chamar. Quem passa o callback precisa chamar
+        dispatch_events() periodicamente (a GUI faz isso a cada 100 ms)
+        e uma vez depois de stop(); sem isso, o callback nunca roda.
         
         Args:
             record_mouse (bool): Se True, grava eventos de mouse. Default: True
             record_keyboard (bool): Se True, grava eventos de teclado. Default: True
-            on_event_callback (Callable, optional): Função chamada para cada evento.
-                Recebe um InputEvent como parâmetro. Default: None
+            on_event_callback (Callable, optional): Função chamada para cada evento,
+                dentro de dispatch_events(). Recebe um InputEvent como
+                parâmetro. Movimentos do mouse são notificados no máximo
+                ~10 vezes por segundo. Default: None
         """
         # ====================================================================
         # CONFIGURAÇÕES DE GRAVAÇÃO
@@ -157,6 +225,10 @@ class Recorder:
         # Usado para calcular o tempo relativo de cada evento
         self._start_time: float = 0.0
         
+        # Relógio dos timestamps, guardado no objeto para os callbacks
+        # não buscarem time.perf_counter no módulo a cada evento
+        self._now = time.perf_counter
+        
         # ====================================================================
         # LISTENERS DO PYNPUT
         # ====================================================================
@@ -176,13 +248,49 @@ class Recorder:
         # Útil para atualizar a interface gráfica em tempo real
         self._on_event_callback = on_event_callback
         
+        # Eventos esperando para serem entregues ao callback
+        # Os listeners só colocam na fila (put_nowait, sem esperar);
+        # a interface retira com dispatch_events() no seu próprio ritmo
+        self._ui_queue: queue.Queue = queue.Queue(maxsize=_UI_QUEUE_MAX)
+        
+        # Momento (time.perf_counter) da última notificação de movimento
+        self._last_move_notify = float('-inf')
+        
         # ====================================================================
         # CONTROLE DE THREAD-SAFETY
         # ====================================================================
         
-        # Lock para garantir que apenas uma thread acesse os dados por vez
-        # Evita problemas quando mouse e teclado capturam eventos simultaneamente
+        # Lock para garantir que apenas um flush() mova eventos por vez
+        # Os callbacks de mouse e teclado nunca o usam (ver _pending)
         self._lock = threading.Lock()
+        
+        # Buffer de eventos capturados que ainda não foram para a session
+        # (ver flush). list.append é atômico no CPython, então os callbacks
+        # de mouse e teclado podem adicionar aqui sem usar o lock.
+        self._pending: List[InputEvent] = []
+        
+        # Buffers dos movimentos do mouse, o evento mais frequente
+        # _move_t: timestamps; _move_xy: x, y de cada movimento em sequência
+        # Só a thread do listener de mouse escreve aqui: primeiro x e y,
+        # por último o timestamp. Um movimento só "existe" depois que seu
+        # timestamp entra em _move_t, então flush() nunca lê um pela metade.
+        self._move_t = array('d')
+        self._move_xy = array('i')
+        
+        # Filtro de movimentos (ver _MOVE_COALESCE_DT_MS e update_settings)
+        self._move_min_dt = _MOVE_COALESCE_DT_MS / 1000.0
+        self._move_min_dx = _MOVE_COALESCE_DX_PX
+        
+        # Caches tecla/botão do pynput -> texto gravado
+        # Uma gravação usa poucas teclas, repetidas muitas vezes: cada uma
+        # vira texto uma vez só, e todas as repetições compartilham o
+        # mesmo objeto str (já internado)
+        self._key_cache: Dict[Any, str] = {}
+        self._button_cache: Dict[Any, str] = dict(_BUTTON_NAMES)
+        
+        # Núcleo da CPU das threads dos listeners (ver set_affinity)
+        # Desligado por padrão: o sistema escolhe
+        self._listener_core: Optional[int] = None
 
     def _get_relative_time(self) -> float:
         """
@@ -198,20 +306,22 @@ class Recorder:
         - Esta função retorna: 2.0 (dois segundos depois)
         
         EXPLICAÇÃO TÉCNICA:
-        Calcula a diferença entre o timestamp atual (time.time()) e o
-        timestamp de início armazenado em _start_time. Retorna em segundos
-        como float para precisão de milissegundos.
+        Calcula a diferença entre o instante atual (time.perf_counter())
+        e o de início armazenado em _start_time. perf_counter é
+        monotônico e de alta resolução: não volta atrás se o relógio do
+        sistema for ajustado, e no Linux é lido sem chamada ao kernel.
+        Os callbacks fazem essa mesma conta direto (sem chamar este
+        método) para economizar uma chamada por evento.
         
         Returns:
             float: Tempo em segundos desde o início da gravação
         """
-        # time.time() retorna o timestamp atual em segundos
-        # Subtraímos o timestamp de início para obter o tempo relativo
-        return time.time() - self._start_time
+        # Subtraímos o instante de início para obter o tempo relativo
+        return self._now() - self._start_time
 
     def _add_event(self, event: InputEvent) -> None:
         """
-        Adiciona um evento à sessão de forma thread-safe.
+        Adiciona um evento à gravação de forma thread-safe.
         
         EXPLICAÇÃO PARA INICIANTES:
         Quando capturamos um evento (clique, tecla, etc.), usamos esta
@@ -222,141 +332,247 @@ class Recorder:
         eventos simultaneamente) sem causar problemas.
         
         EXPLICAÇÃO TÉCNICA:
-        Usa um Lock para garantir exclusão mútua ao acessar a session.
-        Também chama o callback de notificação, se configurado.
+        O evento vai para o buffer _pending com um único list.append
+        (atômico, dispensa o lock). flush() depois move os eventos para
+        a session em lote. Também enfileira a notificação para o
+        callback, se configurado (ver _notify).
         
         Args:
             event (InputEvent): O evento a ser adicionado
         """
-        # with self._lock: adquire o lock antes de executar o bloco
-        # Isso garante que apenas uma thread por vez adicione eventos
-        with self._lock:
-            # Adiciona o evento à sessão
-            self.session.add_event(event)
+        # Adiciona ao buffer; a session recebe os eventos no próximo flush()
+        self._pending.append(event)
         
         # Se há um callback configurado, notifica sobre o novo evento
         # Isso é útil para atualizar a UI em tempo real
         if self._on_event_callback:
-            self._on_event_callback(event)
+            self._notify(event)
 
-    # ========================================================================
-    # CALLBACKS DO MOUSE
-    # ========================================================================
-    
-    def _on_mouse_move(self, x: int, y: int) -> None:
+    def _notify(self, event: InputEvent) -> None:
         """
-        Callback chamado quando o mouse se move.
-        
-        EXPLICAÇÃO PARA INICIANTES:
-        Toda vez que você move o mouse, o pynput chama esta função
-        automaticamente, informando para onde o mouse foi (posição x, y).
-        
-        A posição (x, y) funciona assim:
-        - x é a distância em pixels a partir da borda esquerda da tela
-        - y é a distância em pixels a partir do topo da tela
-        
-        Exemplo: (100, 200) significa 100 pixels à direita e 200 abaixo
+        Enfileira um evento para o callback (entregue por dispatch_events).
         
         EXPLICAÇÃO TÉCNICA:
-        Callback registrado no mouse.Listener. Cria um InputEvent do tipo
-        MOUSE_MOVE com as coordenadas atuais e adiciona à sessão.
+        Nunca bloqueia a thread do listener: com a fila cheia, a
+        notificação é descartada (o evento já está gravado).
         
         Args:
-            x (int): Coordenada X (horizontal) do cursor em pixels
-            y (int): Coordenada Y (vertical) do cursor em pixels
+            event (InputEvent): Evento capturado
         """
-        # Só processa se estamos gravando E se devemos gravar mouse
-        if not self.is_recording or not self.record_mouse:
-            return  # Sai sem fazer nada
-        
-        # Cria o evento de movimento
-        event = InputEvent(
-            timestamp=self._get_relative_time(),    # Quando aconteceu
-            event_type=EventType.MOUSE_MOVE,        # Tipo: movimento de mouse
-            x=int(x),                               # Posição X (convertido para int)
-            y=int(y)                                # Posição Y (convertido para int)
-        )
-        
-        # Adiciona à sessão de forma segura
-        self._add_event(event)
+        try:
+            self._ui_queue.put_nowait(event)
+        except queue.Full:
+            pass
 
-    def _on_mouse_click(self, x: int, y: int, button: mouse.Button, pressed: bool) -> None:
+    def dispatch_events(self, max_items: int = 200) -> int:
         """
-        Callback chamado quando um botão do mouse é clicado ou solto.
+        Entrega ao callback os eventos capturados desde a última chamada.
         
         EXPLICAÇÃO PARA INICIANTES:
-        Quando você clica com o mouse (ou solta o botão), esta função é
-        chamada. Ela recebe:
-        - Onde você clicou (x, y)
-        - Qual botão (esquerdo, direito, meio)
-        - Se foi um "apertar" ou "soltar" o botão
-        
-        Precisamos saber se foi apertar ou soltar para poder reproduzir
-        cliques longos (segurar o botão) corretamente.
+        A interface chama este método de tempos em tempos (junto com a
+        atualização dos contadores). O callback passado no construtor
+        roda aqui, na thread da interface - onde é seguro mexer na tela.
         
         EXPLICAÇÃO TÉCNICA:
-        Callback do mouse.Listener para eventos de clique. O parâmetro
-        button é um enum mouse.Button que convertemos para string legível.
+        Retira até max_items notificações da fila por chamada, para uma
+        rajada de eventos não travar a interface; o resto fica para a
+        próxima.
         
         Args:
-            x (int): Coordenada X do clique
-            y (int): Coordenada Y do clique
-            button (mouse.Button): Qual botão foi clicado (Button.left, etc.)
-            pressed (bool): True se pressionado, False se solto
-        """
-        if not self.is_recording or not self.record_mouse:
-            return
+            max_items (int): Máximo de eventos entregues nesta chamada
         
-        # Converte o enum Button para string legível
-        # button.name retorna 'left', 'right', ou 'middle'
-        button_name = button.name if hasattr(button, 'name') else str(button)
+        Returns:
+            int: Quantos eventos foram entregues
+        """
+        callback = self._on_event_callback
+        if not callback:
+            return 0
+        
+        ui_queue = self._ui_queue
+        delivered = 0
+        while delivered < max_items:
+            try:
+                event = ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            callback(event)
+            delivered += 1
+        return delivered
+
+    def flush(self) -> None:
+        """
+        Passa os eventos acumulados no buffer para a session.
         
-        event = InputEvent(
-            timestamp=self._get_relative_time(),
-            event_type=EventType.MOUSE_CLICK,
-            x=int(x),
-            y=int(y),
-            button=button_name,                     # Nome do botão
-            pressed=pressed                         # Pressionado ou solto?
-        )
+        EXPLICAÇÃO PARA INICIANTES:
+        Os eventos capturados ficam guardados em um "rascunho" e são
+        passados para a gravação de tempos em tempos. Este método faz
+        essa passagem na hora. get_event_count() e stop() já chamam
+        ele automaticamente.
         
-        self._add_event(event)
+        EXPLICAÇÃO TÉCNICA:
+        Copia os primeiros n itens e depois os apaga (pending[:n] e
+        del pending[:n] são operações atômicas). Um evento adicionado
+        por outra thread no meio do caminho fica no fim do buffer e
+        entra no próximo flush - nada se perde e a ordem é mantida.
+        O lock só serializa flushes concorrentes.
+        
+        Os movimentos guardados em _move_t/_move_xy viram InputEvent
+        aqui (mesma técnica: copia os n primeiros e apaga) e são
+        intercalados com os outros eventos pelo timestamp. O callback
+        de eventos recebe só o último movimento do lote, e no máximo a
+        cada _MOVE_NOTIFY_INTERVAL_S.
+        """
+        with self._lock:
+            move_t = self._move_t
+            move_xy = self._move_xy
+            m = len(move_t)
+            moves: List[InputEvent] = []
+            if m:
+                ts = move_t[:m]
+                xy = move_xy[:2 * m]
+                del move_t[:m]
+                del move_xy[:2 * m]
+                
+                move_type = _ET_MOVE
+                moves = [
+                    InputEvent(t, move_type, x, y)
+                    for t, x, y in zip(ts, xy[0::2], xy[1::2])
+                ]
+            
+            pending = self._pending
+            n = len(pending)
+            batch = pending[:n]
+            if n:
+                del pending[:n]
+            
+            if moves:
+                if batch:
+                    batch.extend(moves)
+                    batch.sort(key=_by_timestamp)
+                else:
+                    batch = moves
+            
+            if batch:
+                self.session.add_events(batch)
+        
+        # Notifica o último movimento do lote, no máximo ~10x por segundo
+        if moves and self._on_event_callback:
+            now = self._now()
+            if now - self._last_move_notify >= _MOVE_NOTIFY_INTERVAL_S:
+                self._last_move_notify = now
+                self._notify(moves[-1])
 
-    def _on_mouse_scroll(self, x: int, y: int, dx: int, dy: int) -> None:
+    # ========================================================================
+    # CALLBACKS DO MOUSE
+    # ========================================================================
+    
+    def _make_mouse_callbacks(self) -> Tuple[Callable, Callable, Callable]:
         """
-        Callback chamado quando a rodinha do mouse é usada.
+        Cria as funções que o mouse.Listener chama (movimento, clique, scroll).
         
         EXPLICAÇÃO PARA INICIANTES:
-        Quando você usa a rodinha do mouse para rolar uma página:
-        - dy positivo = rolou para cima
-        - dy negativo = rolou para baixo
-        - dx é para rolagem horizontal (mais raro)
-        
-        Também registramos onde o mouse estava quando você rolou.
+        Toda vez que você move o mouse, clica ou usa a rodinha, o pynput
+        chama uma destas funções automaticamente:
+        
+        - on_move(x, y): o mouse foi para a posição (x, y)
+          x é a distância em pixels a partir da borda esquerda da tela,
+          y a partir do topo. Ex: (100, 200) = 100 px à direita, 200 abaixo
+        - on_click(x, y, button, pressed): um botão foi apertado ou solto
+          Precisamos saber se foi apertar ou soltar para reproduzir
+          cliques longos (segurar o botão) corretamente
+        - on_scroll(x, y, dx, dy): a rodinha girou
+          dy positivo = para cima, negativo = para baixo; dx é a rolagem
+          horizontal (mais rara)
         
         EXPLICAÇÃO TÉCNICA:
-        Callback para eventos de scroll. dx e dy indicam a direção e
-        "intensidade" da rolagem. Valores típicos são +1/-1 ou múltiplos.
+        Chamado por start(), uma vez por gravação (mesmo padrão de
+        Player._make_handlers). As funções guardam em variáveis da
+        closure tudo o que não muda durante a gravação - relógio,
+        início, buffers, limites do filtro - e só leem is_recording de
+        self a cada chamada. O movimento, o mais chamado de todos
+        (centenas de vezes por segundo), não cria objeto nem usa lock:
+        guarda x, y e o timestamp nos arrays _move_xy/_move_t, e flush()
+        monta os InputEvent do tipo MOUSE_MOVE depois, em lote.
+        Movimentos muito próximos do último gravado, no tempo e na
+        distância, são descartados (ver _MOVE_COALESCE_DT_MS).
         
-        Args:
-            x (int): Coordenada X do cursor durante o scroll
-            y (int): Coordenada Y do cursor durante o scroll
-            dx (int): Deslocamento horizontal (scroll horizontal)
-            dy (int): Deslocamento vertical (scroll vertical)
+        Returns:
+            Tuple[Callable, Callable, Callable]: (on_move, on_click, on_scroll)
         """
-        if not self.is_recording or not self.record_mouse:
-            return
-        
-        event = InputEvent(
-            timestamp=self._get_relative_time(),
-            event_type=EventType.MOUSE_SCROLL,
-            x=int(x),
-            y=int(y),
-            dx=int(dx),                             # Scroll horizontal
-            dy=int(dy)                              # Scroll vertical
-        )
-        
-        self._add_event(event)
+        now = self._now
+        start = self._start_time
+        add_event = self._add_event
+        button_cache = self._button_cache
+        move_xy_append = self._move_xy.append
+        move_t_append = self._move_t.append
+        min_dt = self._move_min_dt
+        min_dx = self._move_min_dx
+        click_type = _ET_CLICK
+        scroll_type = _ET_SCROLL
+        
+        # Último movimento gravado (comparado com cada novo)
+        last_t = float('-inf')
+        last_x = 0
+        last_y = 0
+        
+        def on_move(x: int, y: int) -> None:
+            nonlocal last_t, last_x, last_y
+            
+            # Só processa se estamos gravando
+            if not self.is_recording:
+                return  # Sai sem fazer nada
+            
+            # Quando aconteceu (mesma conta de _get_relative_time)
+            timestamp = now() - start
+            x = int(x)  # Posição X (convertido para int)
+            y = int(y)  # Posição Y (convertido para int)
+            
+            # Descarta se for quase igual ao último movimento gravado
+            if timestamp - last_t < min_dt and abs(x - last_x) + abs(y - last_y) < min_dx:
+                return
+            last_t = timestamp
+            last_x = x
+            last_y = y
+            
+            # Posição primeiro, timestamp por último (ver __init__)
+            move_xy_append(x)
+            move_xy_append(y)
+            move_t_append(timestamp)
+        
+        def on_click(x: int, y: int, button: mouse.Button, pressed: bool) -> None:
+            if not self.is_recording:
+                return
+            
+            # Converte o enum Button para string legível
+            # button.name retorna 'left', 'right', ou 'middle'
+            button_name = button_cache.get(button)
+            if button_name is None:
+                button_name = sys.intern(button.name if hasattr(button, 'name') else str(button))
+                button_cache[button] = button_name
+            
+            add_event(InputEvent(
+                timestamp=now() - start,
+                event_type=click_type,
+                x=int(x),
+                y=int(y),
+                button=button_name,                 # Nome do botão
+                pressed=pressed                     # Pressionado ou solto?
+            ))
+        
+        def on_scroll(x: int, y: int, dx: int, dy: int) -> None:
+            if not self.is_recording:
+                return
+            
+            add_event(InputEvent(
+                timestamp=now() - start,
+                event_type=scroll_type,
+                x=int(x),
+                y=int(y),
+                dx=int(dx),                         # Scroll horizontal
+                dy=int(dy)                          # Scroll vertical
+            ))
+        
+        return on_move, on_click, on_scroll
 
     # ========================================================================
     # CALLBACKS DO TECLADO
@@ -379,31 +595,56 @@ class Recorder:
         - KeyCode: teclas com caractere (letras, números, símbolos)
         - Key: teclas especiais (space, enter, ctrl, etc.)
         
+        O resultado fica em _key_cache: a mesma tecla devolve sempre o
+        mesmo objeto str, sem conversão nem novo texto a cada evento.
+        
         Args:
             key: Objeto tecla do pynput (KeyCode ou Key)
         
         Returns:
             str: Representação string da tecla
         """
+        try:
+            cached = self._key_cache.get(key)
+        except TypeError:
+            return self._key_to_string(key)  # Tecla sem hash: não cacheia
+        if cached is not None:
+            return cached
+        
+        key_str = self._key_cache[key] = self._key_to_string(key)
+        return key_str
+
+    def _key_to_string(self, key) -> str:
+        """
+        Faz a conversão de _get_key_string (sem cache).
+        
+        Args:
+            key: Objeto tecla do pynput (KeyCode ou Key)
+        
+        Returns:
+            str: Representação string da tecla (internada)
+        """
         # Tenta diferentes formas de obter o valor da tecla
         try:
             # Se é uma tecla com caractere (letra, número)
             # keyboard.KeyCode tem o atributo 'char'
+            # sys.intern: a mesma tecla gravada mil vezes vira um único
+            # texto na memória (ver _intern_str em events.py)
             if hasattr(key, 'char') and key.char is not None:
-                return key.char  # Retorna o caractere ('a', '1', etc.)
+                return sys.intern(key.char)  # Retorna o caractere ('a', '1', etc.)
             
             # Se é uma tecla especial (space, enter, ctrl, etc.)
             # keyboard.Key tem o atributo 'name'
             elif hasattr(key, 'name'):
-                return key.name  # Retorna o nome ('space', 'enter', etc.)
+                return sys.intern(key.name)  # Retorna o nome ('space', 'enter', etc.)
             
             # Caso genérico - converte para string
             else:
-                return str(key)
+                return sys.intern(str(key))
                 
         except Exception:
             # Se algo der errado, retorna a representação string padrão
-            return str(key)
+            return sys.intern(str(key))
 
     def _on_key_press(self, key) -> None:
         """
@@ -431,8 +672,8 @@ class Recorder:
         key_str = self._get_key_string(key)
         
         event = InputEvent(
-            timestamp=self._get_relative_time(),
-            event_type=EventType.KEY_PRESS,
+            timestamp=self._now() - self._start_time,
+            event_type=_ET_KEY_PRESS,
             key=key_str,                            # Qual tecla
             pressed=True                            # Foi pressionada (não solta)
         )
@@ -460,8 +701,8 @@ class Recorder:
         key_str = self._get_key_string(key)
         
         event = InputEvent(
-            timestamp=self._get_relative_time(),
-            event_type=EventType.KEY_RELEASE,
+            timestamp=self._now() - self._start_time,
+            event_type=_ET_KEY_RELEASE,
             key=key_str,
             pressed=False                           # Foi solta (não pressionada)
         )
@@ -506,9 +747,17 @@ class Recorder:
             record_mouse=self.record_mouse,
             record_keyboard=self.record_keyboard
         )
+        self._pending = []
+        self._move_t = array('d')
+        self._move_xy = array('i')
+        
+        # Fila de notificações nova: o que a gravação anterior deixou
+        # sem entregar não aparece nesta
+        self._ui_queue = queue.Queue(maxsize=_UI_QUEUE_MAX)
+        self._last_move_notify = float('-inf')
         
         # Marca o momento de início (usado para calcular tempos relativos)
-        self._start_time = time.time()
+        self._start_time = self._now()
         
         # Atualiza o estado
         self.is_recording = True
@@ -518,13 +767,17 @@ class Recorder:
         # --------------------------------------------------------------------
         
         # Cria e inicia o listener de mouse (se configurado para gravar)
+        # Nomes nas threads para identificá-las em ferramentas de perfil
         if self.record_mouse:
+            on_move, on_click, on_scroll = self._make_mouse_callbacks()
             self._mouse_listener = mouse.Listener(
-                on_move=self._on_mouse_move,        # Callback para movimento
-                on_click=self._on_mouse_click,      # Callback para clique
-                on_scroll=self._on_mouse_scroll     # Callback para scroll
+                on_move=on_move,        # Callback para movimento
+                on_click=on_click,      # Callback para clique
+                on_scroll=on_scroll     # Callback para scroll
             )
+            self._mouse_listener.name = "TarefAuto-RecordMouse"
             self._mouse_listener.start()  # Inicia a thread do listener
+            self._pin_listener(self._mouse_listener)
         
         # Cria e inicia o listener de teclado (se configurado para gravar)
         if self.record_keyboard:
@@ -532,7 +785,9 @@ class Recorder:
                 on_press=self._on_key_press,        # Callback para tecla pressionada
                 on_release=self._on_key_release     # Callback para tecla solta
             )
+            self._keyboard_listener.name = "TarefAuto-RecordKeyboard"
             self._keyboard_listener.start()  # Inicia a thread do listener
+            self._pin_listener(self._keyboard_listener)
         
         print("Gravação iniciada!")
 
@@ -580,6 +835,9 @@ class Recorder:
             self._keyboard_listener.stop()
             self._keyboard_listener = None
         
+        # Passa para a session os eventos que ainda estão no buffer
+        self.flush()
+        
         # Mostra estatísticas da gravação
         num_events = len(self.session.events)
         duration = self.session.get_duration()
@@ -588,7 +846,13 @@ class Recorder:
         # Retorna a sessão completa
         return self.session
 
-    def update_settings(self, record_mouse: bool, record_keyboard: bool) -> None:
+    def update_settings(
+        self,
+        record_mouse: bool,
+        record_keyboard: bool,
+        move_coalesce_dt_ms: Optional[float] = None,
+        move_coalesce_dx_px: Optional[int] = None
+    ) -> None:
         """
         Atualiza as configurações de gravação.
         
@@ -603,13 +867,86 @@ class Recorder:
         EXPLICAÇÃO TÉCNICA:
         Atualiza os flags de configuração. Não afeta gravação em andamento
         pois os listeners já foram criados com as configurações anteriores.
+        O filtro de movimentos também vale a partir da próxima gravação.
         
         Args:
             record_mouse (bool): Se deve gravar eventos de mouse
             record_keyboard (bool): Se deve gravar eventos de teclado
+            move_coalesce_dt_ms (float, optional): Intervalo (ms) abaixo do
+                qual movimentos próximos são descartados. 0 desliga o filtro.
+                None mantém o valor atual
+            move_coalesce_dx_px (int, optional): Distância (px, |dx| + |dy|)
+                abaixo da qual movimentos são considerados iguais.
+                None mantém o valor atual
         """
         self.record_mouse = record_mouse
         self.record_keyboard = record_keyboard
+        
+        if move_coalesce_dt_ms is not None:
+            self._move_min_dt = max(0.0, move_coalesce_dt_ms) / 1000.0
+        if move_coalesce_dx_px is not None:
+            self._move_min_dx = max(0, int(move_coalesce_dx_px))
+
+    def set_affinity(self, core: Optional[int]) -> None:
+        """
+        Prende as threads dos listeners a um núcleo da CPU.
+        
+        EXPLICAÇÃO PARA INICIANTES:
+        Se a interface e a captura disputam o mesmo núcleo do processador,
+        movimentos do mouse podem ser registrados com atraso quando a
+        tela está ocupada. Isto deixa a captura em um núcleo fixo.
+        
+        EXPLICAÇÃO TÉCNICA:
+        Aplicado em start(), logo depois de iniciar cada listener, pelo
+        id da thread no sistema (Thread.native_id). Linux:
+        os.sched_setaffinity; Windows: OpenThread + SetThreadAffinityMask.
+        Índices negativos contam do último núcleo disponível (-1 = o
+        último, normalmente longe da thread da interface). Sem suporte
+        ou permissão, a gravação segue normalmente.
+        
+        Args:
+            core: Núcleo da CPU (0, 1, 2... ou -1 para o último), ou
+                None para deixar o sistema escolher
+        """
+        self._listener_core = core
+
+    def _pin_listener(self, listener: threading.Thread) -> None:
+        """
+        Aplica set_affinity() à thread de um listener já iniciado.
+        
+        Args:
+            listener: Listener do pynput (uma threading.Thread)
+        """
+        core = self._listener_core
+        thread_id = getattr(listener, "native_id", None)
+        if core is None or thread_id is None:
+            return
+        
+        if sys.platform == "win32":
+            try:
+                import ctypes
+                from ctypes import wintypes
+                
+                kernel32 = ctypes.windll.kernel32
+                kernel32.OpenThread.restype = wintypes.HANDLE
+                if core < 0:
+                    core += os.cpu_count() or 1
+                # THREAD_SET_INFORMATION | THREAD_QUERY_INFORMATION
+                handle = kernel32.OpenThread(0x0060, False, thread_id)
+                if handle:
+                    kernel32.SetThreadAffinityMask(handle, ctypes.c_size_t(1 << core))
+                    kernel32.CloseHandle(handle)
+            except (OSError, AttributeError, ValueError) as e:
+                print(f"Não foi possível fixar {listener.name} no núcleo {core}: {e}")
+            return
+        
+        if hasattr(os, "sched_setaffinity"):
+            try:
+                if core < 0:
+                    core = sorted(os.sched_getaffinity(0))[core]
+                os.sched_setaffinity(thread_id, {core})
+            except (OSError, IndexError) as e:
+                print(f"Não foi possível fixar {listener.name} no núcleo {core}: {e}")
 
     def get_event_count(self) -> int:
         """
@@ -620,13 +957,17 @@ class Recorder:
         já foram capturados. Um "contador" de ações, basicamente.
         
         EXPLICAÇÃO TÉCNICA:
-        Acessa a lista de eventos da sessão de forma thread-safe.
+        Descarrega o buffer (flush) e lê o tamanho da lista de eventos.
+        Como a GUI chama este método a cada atualização, a session fica
+        sempre em dia para a tela. len() de uma lista é atômico no
+        CPython, então a leitura dispensa o lock (que fica só para os
+        flushes).
         
         Returns:
             int: Número de eventos na sessão atual
         """
-        with self._lock:
-            return len(self.session.events)
+        self.flush()
+        return len(self.session.events)
 
 
 # ============================================================================
@@ -642,19 +983,32 @@ if __name__ == "__main__":
     print()
     
     # Cria o recorder com ambos mouse e teclado habilitados
-    recorder = Recorder(record_mouse=True, record_keyboard=True)
+    # O callback só roda dentro de dispatch_events(), chamado abaixo
+    notified = []
+    recorder = Recorder(
+        record_mouse=True,
+        record_keyboard=True,
+        on_event_callback=notified.append
+    )
     
     # Inicia a gravação
     recorder.start()
     
-    # Espera 5 segundos
-    time.sleep(5)
+    # Espera 5 segundos, entregando as notificações a cada 100 ms
+    # (como a GUI faz em _update_ui)
+    deadline = time.perf_counter() + 5
+    while time.perf_counter() < deadline:
+        time.sleep(0.1)
+        recorder.dispatch_events()
     
-    # Para a gravação
+    # Para a gravação e entrega o que ainda estava na fila
     session = recorder.stop()
+    while recorder.dispatch_events():
+        pass
     
     # Mostra os resultados
     print(f"\nEventos capturados: {len(session.events)}")
+    print(f"Notificações entregues ao callback: {len(notified)}")
     print(f"Duração: {session.get_duration():.2f} segundos")
     
     # Mostra os primeiros 10 eventos como exemplo
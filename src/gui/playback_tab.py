@@ -49,7 +49,7 @@ from typing import Optional, Callable
 # Importações internas
 from src.gui.theme import TarefAutoTheme
 from src.core.player import Player, LoopMode
-from src.core.events import RecordingSession
+from src.core.events import RecordingSession, BINARY_EXTENSION
 
 
 # ============================================================================
@@ -522,7 +522,8 @@ class PlaybackTab(ctk.CTkFrame):
         Carrega uma gravação de um arquivo.
         
         EXPLICAÇÃO PARA INICIANTES:
-        Abre uma janela para você escolher um arquivo de gravação (.json).
+        Abre uma janela para você escolher um arquivo de gravação (.json
+        ou o formato binário .tarefa).
         Depois de carregar, você pode reproduzir as ações gravadas.
         
         EXPLICAÇÃO TÉCNICA:
@@ -531,7 +532,9 @@ class PlaybackTab(ctk.CTkFrame):
         filepath = filedialog.askopenfilename(
             title="Carregar Gravação",
             filetypes=[
+                ("Gravações", f"*.json *{BINARY_EXTENSION}"),
                 ("Arquivos JSON", "*.json"),
+                ("Gravação binária (compacta)", f"*{BINARY_EXTENSION}"),
                 ("Todos os arquivos", "*.*")
             ]
         )
@@ -595,11 +598,13 @@ class PlaybackTab(ctk.CTkFrame):
         else:
             loop_value = 1
         
-        # Cria o player com callbacks
-        self.player = Player(
-            on_progress_callback=self._on_progress,
-            on_complete_callback=self._on_playback_complete
-        )
+        # Cria o player com callbacks (uma vez; a thread de reprodução
+        # dele é reaproveitada nas próximas reproduções)
+        if self.player is None:
+            self.player = Player(
+                on_progress_callback=self._on_progress,
+                on_complete_callback=self._on_playback_complete
+            )
         
         # Configura o player
         self.player.set_loop_mode(loop_mode, loop_value)
@@ -53,7 +53,7 @@ from typing import Optional, Callable
 # Importações internas
 from src.gui.theme import TarefAutoTheme
 from src.core.recorder import Recorder
-from src.core.events import RecordingSession, InputEvent
+from src.core.events import RecordingSession, InputEvent, BINARY_EXTENSION
 
 
 # ============================================================================
@@ -543,6 +543,11 @@ class RecordingTab(ctk.CTkFrame):
         # Para a gravação e obtém a sessão
         self.current_session = self.recorder.stop()
         
+        # Entrega as notificações que ainda estavam na fila (o
+        # _update_ui só as entrega enquanto a gravação está ativa)
+        while self.recorder.dispatch_events():
+            pass
+        
         # Para as atualizações da UI
         self._stop_ui_updates()
         
@@ -614,14 +619,14 @@ class RecordingTab(ctk.CTkFrame):
         da interface acontece em outro lugar (para ser mais eficiente).
         
         EXPLICAÇÃO TÉCNICA:
-        Callback do Recorder. Pode ser usado para processamento em tempo
-        real, mas atualizações de UI devem ser feitas via after() para
-        thread-safety.
+        Callback do Recorder, entregue por recorder.dispatch_events() a
+        partir de _update_ui() (e uma última vez em _stop_recording) -
+        já roda na thread principal do Tk.
         
         Args:
             event: O evento capturado
         """
-        # A atualização do contador é feita em _update_ui() para thread-safety
+        # O contador é atualizado uma vez por ciclo em _update_ui()
         pass
 
     def _update_ui_recording_state(self, is_recording: bool) -> None:
@@ -717,6 +722,10 @@ class RecordingTab(ctk.CTkFrame):
         if self.recorder and self.recorder.is_recording:
             # Atualiza contador de eventos
             count = self.recorder.get_event_count()
+            
+            # Entrega ao _on_event_captured os eventos novos, aqui na
+            # thread da interface
+            self.recorder.dispatch_events()
             self._event_count_label.configure(text=f"Eventos: {count}")
             
             # Atualiza duração
@@ -754,6 +763,7 @@ class RecordingTab(ctk.CTkFrame):
             defaultextension=".json",
             filetypes=[
                 ("Arquivos JSON", "*.json"),
+                ("Gravação binária (compacta)", f"*{BINARY_EXTENSION}"),
                 ("Todos os arquivos", "*.*")
             ],
             initialdir=initial_dir,
@@ -767,7 +777,11 @@ class RecordingTab(ctk.CTkFrame):
                 self._last_saved_file = filepath
                 filename = os.path.basename(filepath)
                 self._file_label.configure(text=f"📁 {filename}")
-                self._edit_button.configure(state="normal")
+                # O formato binário não pode ser editado em editor de texto
+                if filepath.lower().endswith(BINARY_EXTENSION):
+                    self._edit_button.configure(state="disabled")
+                else:
+                    self._edit_button.configure(state="normal")
                 
                 messagebox.showinfo(
                     "Sucesso",